@@ -5,16 +5,25 @@ Implements TTL-based caching with automatic expiration and cache invalidation.
 """
 
 import asyncio
+import bisect
 import hashlib
-import json
+import heapq
 import logging
 import threading
-from datetime import datetime, timedelta
-from typing import Any, Optional, Dict, Callable
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Optional, Dict, Iterable, List, Tuple, Callable
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for single-probe dict removals
+_MISSING = object()
+
+# Offset for presenting monotonic timestamps as wall-clock datetimes
+_MONOTONIC_TO_WALL = time.time() - time.monotonic()
+
 
 class CacheEntry:
     """
@@ -22,31 +31,54 @@ class CacheEntry:
 
     Attributes:
         data: The cached data
-        expiry: When this entry expires
-        created_at: When this entry was created
+        expiry: When this entry expires (wall-clock view of the deadline)
+        created_at: When this entry was created (wall-clock view)
         hit_count: Number of times this entry was retrieved
+
+    Timestamps are stored as ``time.monotonic()`` floats so the hot
+    expiry check is a single float comparison and is immune to system
+    clock adjustments.
     """
 
-    def __init__(self, data: Any, ttl_seconds: int):
+    __slots__ = ('data', '_created', '_expiry', 'hit_count', '_clock')
+
+    def __init__(
+        self,
+        data: Any,
+        ttl_seconds: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
         """
         Initialize cache entry.
 
         Args:
             data: The data to cache
             ttl_seconds: Time to live in seconds
+            clock: Monotonic time source (default: time.monotonic)
         """
         self.data = data
-        self.created_at = datetime.now()
-        self.expiry = self.created_at + timedelta(seconds=ttl_seconds)
+        self._clock = clock
+        self._created = clock()
+        self._expiry = self._created + ttl_seconds
         self.hit_count = 0
 
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a datetime."""
+        return datetime.fromtimestamp(self._created + _MONOTONIC_TO_WALL)
+
+    @property
+    def expiry(self) -> datetime:
+        """Expiry time as a datetime."""
+        return datetime.fromtimestamp(self._expiry + _MONOTONIC_TO_WALL)
+
     def is_expired(self) -> bool:
         """Check if this entry has expired."""
-        return datetime.now() >= self.expiry
+        return self._clock() >= self._expiry
 
     def age_seconds(self) -> float:
         """Get age of this entry in seconds."""
-        return (datetime.now() - self.created_at).total_seconds()
+        return self._clock() - self._created
 
     def record_hit(self):
         """Record a cache hit."""
@@ -59,6 +91,7 @@ class Cache:
 
     Features:
     - Automatic expiration based on TTL
+    - O(1) least-recently-used eviction when full
     - Cache statistics (hits, misses, size)
     - Namespace support for organizing cache keys
     - Periodic cleanup of expired entries
@@ -68,7 +101,8 @@ class Cache:
         self,
         default_ttl_seconds: int = 300,
         max_size: int = 1000,
-        cleanup_interval_seconds: int = 60
+        cleanup_interval_seconds: int = 60,
+        clock: Callable[[], float] = time.monotonic
     ):
         """
         Initialize cache.
@@ -77,12 +111,19 @@ class Cache:
             default_ttl_seconds: Default TTL for cache entries (default: 300 = 5 minutes)
             max_size: Maximum number of entries (default: 1000)
             cleanup_interval_seconds: How often to clean expired entries (default: 60)
+            clock: Monotonic time source shared with entries (default: time.monotonic)
         """
         self.default_ttl = default_ttl_seconds
         self.max_size = max_size
         self.cleanup_interval = cleanup_interval_seconds
-
-        self._cache: Dict[str, CacheEntry] = {}
+        self._clock = clock
+
+        # Ordered from least to most recently used
+        self._cache: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        # Sorted key index so prefix invalidation touches only matching keys
+        self._sorted_keys: List[str] = []
+        # Min-heap of (expiry, key); stale items are skipped lazily
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._stats = {
             'hits': 0,
             'misses': 0,
@@ -90,28 +131,53 @@ class Cache:
             'expirations': 0
         }
 
-        # Thread-safety lock for concurrent access
-        self._lock = threading.RLock()
+        # Thread-safety lock for concurrent access (no method re-enters it)
+        self._lock = threading.Lock()
 
-        # Start cleanup task
+        # Start cleanup task, bound to the loop it runs on
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._cleanup_loop: Optional[asyncio.AbstractEventLoop] = None
         self._start_cleanup()
 
     def _start_cleanup(self):
-        """Start periodic cleanup task."""
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
-        except RuntimeError:
-            # No event loop, cleanup will be manual
-            pass
+        """
+        Ensure a periodic cleanup task runs on the current event loop.
+
+        Does nothing outside a running loop (cleanup is then manual). A task
+        that has finished, or that belongs to another (possibly closed)
+        loop, is replaced by one on the running loop.
+        """
+        # None rather than RuntimeError outside a loop keeps this cheap
+        # enough for get_cache()'s fast path
+        loop = asyncio._get_running_loop()
+        if loop is None:
+            return
+        if self._cleanup_loop is loop and not self._cleanup_task.done():
+            return
+
+        with self._lock:
+            # Re-check: another thread may have attached a task meanwhile
+            if self._cleanup_loop is loop and not self._cleanup_task.done():
+                return
+            self._cleanup_task = loop.create_task(self._periodic_cleanup())
+            self._cleanup_loop = loop
+
+    def _next_expiry_delay(self) -> float:
+        """Seconds until the earliest entry expires, capped at cleanup_interval."""
+        # Other threads push and pop the heap under the lock
+        with self._lock:
+            heap = self._expiry_heap
+            if not heap:
+                return self.cleanup_interval
+            next_expiry = heap[0][0]
+        delay = next_expiry - self._clock()
+        return min(max(delay, 0.0), self.cleanup_interval)
 
     async def _periodic_cleanup(self):
-        """Periodically clean expired entries."""
+        """Clean expired entries as they fall due, off the request path."""
         while True:
             try:
-                await asyncio.sleep(self.cleanup_interval)
+                await asyncio.sleep(self._next_expiry_delay())
                 self.cleanup_expired()
             except asyncio.CancelledError:
                 break
@@ -126,13 +192,25 @@ class Cache:
             Number of entries removed
         """
         with self._lock:
-            before_count = len(self._cache)
-            self._cache = {
-                key: entry
-                for key, entry in self._cache.items()
-                if not entry.is_expired()
-            }
-            removed_count = before_count - len(self._cache)
+            now = self._clock()
+            heap = self._expiry_heap
+            removed_count = 0
+
+            # Only pop heap heads that are due; items whose key was removed
+            # or re-set since they were pushed are discarded
+            while heap and heap[0][0] <= now:
+                expiry, key = heapq.heappop(heap)
+                entry = self._cache.get(key)
+                if entry is not None and entry._expiry == expiry:
+                    self._delete(key)
+                    removed_count += 1
+
+            # Rebuild if stale items dominate (keys overwritten or invalidated)
+            if len(heap) > 2 * len(self._cache) + 64:
+                self._expiry_heap = [
+                    (entry._expiry, key) for key, entry in self._cache.items()
+                ]
+                heapq.heapify(self._expiry_heap)
 
             if removed_count > 0:
                 self._stats['expirations'] += removed_count
@@ -158,13 +236,14 @@ class Cache:
                 return None
 
             if entry.is_expired():
-                del self._cache[key]
+                self._delete(key)
                 self._stats['expirations'] += 1
                 self._stats['misses'] += 1
                 return None
 
             entry.record_hit()
             self._stats['hits'] += 1
+            self._cache.move_to_end(key)
 
             logger.debug(
                 f"Cache hit: {key} (age: {entry.age_seconds():.1f}s, "
@@ -188,30 +267,86 @@ class Cache:
             ttl_seconds: TTL for this entry (uses default if None)
         """
         with self._lock:
-            # Check if we need to evict entries
-            if len(self._cache) >= self.max_size and key not in self._cache:
+            ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
+            if key not in self._cache:
+                bisect.insort(self._sorted_keys, key)
+            entry = CacheEntry(value, ttl, self._clock)
+            self._cache[key] = entry
+            heapq.heappush(self._expiry_heap, (entry._expiry, key))
+            self._cache.move_to_end(key)
+
+            # Evict least recently used entries if over capacity
+            while len(self._cache) > self.max_size:
                 self._evict_oldest()
 
+            logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+
+    def bulk_set(
+        self,
+        items: Iterable[Tuple[str, Any]],
+        ttl_seconds: Optional[int] = None
+    ) -> int:
+        """
+        Set many values in cache under a single lock acquire.
+
+        Equivalent to calling set() for each item in order, but the key
+        index is re-sorted once and eviction runs once at the end.
+
+        Args:
+            items: Iterable of (key, value) pairs
+            ttl_seconds: TTL shared by all entries (uses default if None)
+
+        Returns:
+            Number of items stored
+        """
+        with self._lock:
             ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl
-            self._cache[key] = CacheEntry(value, ttl)
+            cache = self._cache
+            heap = self._expiry_heap
+            clock = self._clock
+            new_keys = []
+            count = 0
+
+            for key, value in items:
+                if key not in cache:
+                    new_keys.append(key)
+                entry = CacheEntry(value, ttl, clock)
+                cache[key] = entry
+                cache.move_to_end(key)
+                heap.append((entry._expiry, key))
+                count += 1
+
+            if new_keys:
+                self._sorted_keys.extend(new_keys)
+                self._sorted_keys.sort()
+            heapq.heapify(heap)
+
+            while len(cache) > self.max_size:
+                self._evict_oldest()
 
-            logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+            logger.debug(f"Cache bulk set: {count} entries (TTL: {ttl}s)")
+            return count
 
     def _evict_oldest(self):
-        """Evict oldest entry to make room."""
+        """Evict least recently used entry to make room."""
         if not self._cache:
             return
 
-        # Find oldest entry
-        oldest_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].created_at
-        )
-
-        del self._cache[oldest_key]
+        oldest_key = next(iter(self._cache))
+        self._delete(oldest_key)
         self._stats['evictions'] += 1
         logger.debug(f"Cache eviction: {oldest_key}")
 
+    def _delete(self, key: str):
+        """Remove a present key from the cache and its prefix index."""
+        del self._cache[key]
+        self._unindex(key)
+
+    def _unindex(self, key: str):
+        """Remove a key from the sorted prefix index."""
+        index = bisect.bisect_left(self._sorted_keys, key)
+        del self._sorted_keys[index]
+
     def invalidate(self, key: str) -> bool:
         """
         Invalidate (remove) a cache entry.
@@ -223,11 +358,11 @@ class Cache:
             True if entry was removed, False if not found
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                logger.debug(f"Cache invalidation: {key}")
-                return True
-            return False
+            if self._cache.pop(key, _MISSING) is _MISSING:
+                return False
+            self._unindex(key)
+            logger.debug(f"Cache invalidation: {key}")
+            return True
 
     def invalidate_prefix(self, prefix: str) -> int:
         """
@@ -240,10 +375,14 @@ class Cache:
             Number of entries invalidated
         """
         with self._lock:
-            keys_to_remove = [
-                key for key in self._cache.keys()
-                if key.startswith(prefix)
-            ]
+            # Matching keys form one contiguous run in the sorted index
+            start = bisect.bisect_left(self._sorted_keys, prefix)
+            end = start
+            while end < len(self._sorted_keys) and self._sorted_keys[end].startswith(prefix):
+                end += 1
+
+            keys_to_remove = self._sorted_keys[start:end]
+            del self._sorted_keys[start:end]
 
             for key in keys_to_remove:
                 del self._cache[key]
@@ -261,6 +400,8 @@ class Cache:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._sorted_keys.clear()
+            self._expiry_heap.clear()
             logger.info(f"Cache cleared: {count} entries removed")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -271,23 +412,27 @@ class Cache:
             Dictionary with cache statistics
         """
         with self._lock:
-            total_requests = self._stats['hits'] + self._stats['misses']
-            hit_rate = (
-                (self._stats['hits'] / total_requests * 100)
-                if total_requests > 0
-                else 0
-            )
-
-            return {
-                'size': len(self._cache),
-                'max_size': self.max_size,
-                'hits': self._stats['hits'],
-                'misses': self._stats['misses'],
-                'hit_rate_percent': round(hit_rate, 2),
-                'evictions': self._stats['evictions'],
-                'expirations': self._stats['expirations'],
-                'total_requests': total_requests
-            }
+            stats = self._stats
+            hits = stats['hits']
+            misses = stats['misses']
+            size = len(self._cache)
+            evictions = stats['evictions']
+            expirations = stats['expirations']
+
+        # Derived values are computed from the snapshot outside the lock
+        total_requests = hits + misses
+        hit_rate = hits * 100.0 / max(total_requests, 1)
+
+        return {
+            'size': size,
+            'max_size': self.max_size,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate_percent': round(hit_rate, 2),
+            'evictions': evictions,
+            'expirations': expirations,
+            'total_requests': total_requests
+        }
 
     async def close(self):
         """
@@ -306,6 +451,8 @@ class Cache:
                 pass
             except Exception as e:
                 logger.error(f"Error during cache cleanup task cancellation: {e}")
+        self._cleanup_task = None
+        self._cleanup_loop = None
 
     def __del__(self):
         """
@@ -322,6 +469,8 @@ class Cache:
 
 # Global cache instance
 _global_cache: Optional[Cache] = None
+# Guards only the None -> instance transition in get_cache()
+_global_cache_lock = threading.Lock()
 
 
 def get_cache(
@@ -340,13 +489,20 @@ def get_cache(
     """
     global _global_cache
 
-    if _global_cache is None:
-        _global_cache = Cache(
-            default_ttl_seconds=default_ttl_seconds,
-            max_size=max_size
-        )
-
-    return _global_cache
+    # Lock-free fast path once the instance exists; attaches the expiry
+    # task the first time the cache is used on a given running loop
+    cache = _global_cache
+    if cache is not None:
+        cache._start_cleanup()
+        return cache
+
+    with _global_cache_lock:
+        if _global_cache is None:
+            _global_cache = Cache(
+                default_ttl_seconds=default_ttl_seconds,
+                max_size=max_size
+            )
+        return _global_cache
 
 
 async def close_global_cache():
@@ -362,6 +518,22 @@ async def close_global_cache():
         _global_cache = None
 
 
+def _key_repr(value: Any) -> str:
+    """
+    Stable text form of a cache key argument.
+
+    Dict entries are sorted so equal mappings give the same key regardless
+    of insertion order; lists and tuples are normalized element-wise.
+    """
+    if isinstance(value, dict):
+        return '{' + ', '.join(sorted(
+            f"{_key_repr(k)}: {_key_repr(v)}" for k, v in value.items()
+        )) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(map(_key_repr, value)) + ']'
+    return repr(value)
+
+
 def make_cache_key(*args, **kwargs) -> str:
     """
     Generate cache key from function arguments.
@@ -373,18 +545,15 @@ def make_cache_key(*args, **kwargs) -> str:
     Returns:
         Cache key string
     """
-    # Serialize arguments to JSON
-    key_data = {
-        'args': args,
-        'kwargs': sorted(kwargs.items())
-    }
-
-    key_json = json.dumps(key_data, sort_keys=True, default=str)
-
-    # Hash for shorter keys
-    key_hash = hashlib.sha256(key_json.encode()).hexdigest()[:16]
+    # Encode each argument once and hash the joined buffer in a single pass
+    parts = [_key_repr(arg).encode() for arg in args]
+    parts.extend(
+        f"{name}={_key_repr(value)}".encode()
+        for name, value in sorted(kwargs.items())
+    )
 
-    return key_hash
+    # BLAKE2b with an 8-byte digest yields a 16-char hex key
+    return hashlib.blake2b(b"\x1f".join(parts), digest_size=8).hexdigest()
 
 
 def cached(
@@ -474,11 +643,14 @@ class CachedService:
         self.cache_namespace = cache_namespace
         self.cache_ttl = cache_ttl
         self.cache = get_cache()
+        # Fixed for the service's lifetime; reused by every key build
+        self._key_prefix = f"{cache_namespace}:"
 
     def _make_cache_key(self, *parts) -> str:
         """Create cache key with namespace."""
-        key_parts = [self.cache_namespace] + [str(p) for p in parts]
-        return ':'.join(key_parts)
+        if not parts:
+            return self.cache_namespace
+        return self._key_prefix + ':'.join(map(str, parts))
 
     def _get_cached(self, *key_parts) -> Optional[Any]:
         """Get value from cache."""
@@ -497,7 +669,7 @@ class CachedService:
 
     def _invalidate_all(self):
         """Invalidate all cache entries for this service."""
-        self.cache.invalidate_prefix(f"{self.cache_namespace}:")
+        self.cache.invalidate_prefix(self._key_prefix)
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
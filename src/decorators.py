@@ -7,6 +7,7 @@ in Azure DevOps API operations.
 
 import asyncio
 import logging
+import random
 from functools import wraps
 from typing import Callable, TypeVar, Any, Optional
 
@@ -24,6 +25,10 @@ T = TypeVar('T')
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# asyncio.timeout (Python 3.11+) cancels in place instead of wrapping the
+# coroutine in a new Task like asyncio.wait_for does
+_asyncio_timeout = getattr(asyncio, 'timeout', None)
+
 
 def handle_ado_error(func: Callable[..., T]) -> Callable[..., T]:
     """
@@ -111,11 +116,15 @@ def retry_on_transient_error(
     max_retries: int = 3,
     base_delay: float = 1.0,
     exponential_base: float = 2.0,
-    max_delay: float = 60.0
+    max_delay: float = 60.0,
+    jitter: float = 0.0
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator to retry operations on transient errors with exponential backoff.
 
+    Backoff waits with asyncio.sleep, so other coroutines keep running while
+    a call is waiting to retry.
+
     Automatically retries on:
     - Rate limit errors (429)
     - Server errors (500, 502, 503, 504)
@@ -125,6 +134,9 @@ def retry_on_transient_error(
         base_delay: Initial delay in seconds (default: 1.0)
         exponential_base: Base for exponential backoff (default: 2.0)
         max_delay: Maximum delay between retries (default: 60.0)
+        jitter: Random extra fraction of the backoff delay, e.g. 0.1 adds
+            up to 10% so concurrent callers don't retry in lockstep
+            (default: 0.0)
 
     Returns:
         Decorator function
@@ -135,12 +147,24 @@ def retry_on_transient_error(
         async def get_work_item(self, work_item_id: int):
             return self.wit_client.get_work_item(id=work_item_id)
     """
+    # Backoff schedule is fixed by the arguments; compute it once
+    backoff_delays = [
+        min(base_delay * (exponential_base ** attempt), max_delay)
+        for attempt in range(max_retries)
+    ]
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if max_retries <= 0:
+            # Nothing to retry; avoid the wrapper entirely
+            return func
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             last_error = None
 
             for attempt in range(max_retries + 1):
+                # Only transient errors are caught; anything else
+                # (non-transient or unknown) propagates without a retry
                 try:
                     return await func(*args, **kwargs)
                 except (RateLimitError, TransientError) as e:
@@ -159,10 +183,9 @@ def retry_on_transient_error(
                         delay = min(e.retry_after, max_delay)
                     else:
                         # Exponential backoff
-                        delay = min(
-                            base_delay * (exponential_base ** attempt),
-                            max_delay
-                        )
+                        delay = backoff_delays[attempt]
+                        if jitter:
+                            delay *= 1 + random.uniform(0, jitter)
 
                     logger.warning(
                         f"Transient error in {func.__name__} (attempt {attempt + 1}/{max_retries}): "
@@ -170,12 +193,6 @@ def retry_on_transient_error(
                     )
 
                     await asyncio.sleep(delay)
-                except AzureDevOpsError:
-                    # Non-transient error, don't retry
-                    raise
-                except Exception:
-                    # Unknown error, don't retry
-                    raise
 
             # Should never reach here, but raise last error if we do
             if last_error:
@@ -206,6 +223,9 @@ def with_timeout(timeout_seconds: int = 30) -> Callable[[Callable[..., T]], Call
         @wraps(func)
         async def wrapper(*args, **kwargs):
             try:
+                if _asyncio_timeout is not None:
+                    async with _asyncio_timeout(timeout_seconds):
+                        return await func(*args, **kwargs)
                 return await asyncio.wait_for(
                     func(*args, **kwargs),
                     timeout=timeout_seconds
@@ -614,7 +614,10 @@ async def batch_update_work_items(
         project: Azure DevOps project name. If None, uses default project.
 
     Returns:
-        List of updated work items (includes success/error status for each)
+        List of updated work items, one per distinct work item ID in order of
+        first appearance (includes success/error status for each). Updates
+        that repeat an ID are merged into one write: later field values win
+        and comments are joined with newlines.
 
     Example:
         updates = [
@@ -822,6 +825,7 @@ async def execute_query_by_id(
     query_id: str,
     project: Optional[str] = None,
     limit: int = 100,
+    force_refresh: bool = False,
     ctx: Context = None
 ) -> List[Dict[str, Any]]:
     """
@@ -834,6 +838,8 @@ async def execute_query_by_id(
         query_id: Query ID (GUID) or path (e.g., "Shared Queries/Sprint Backlog")
         project: Azure DevOps project name. If None, uses default project.
         limit: Maximum number of results to return (default: 100, max: 1000)
+        force_refresh: Re-run the query even if results were cached in the
+            last few seconds (default: False)
 
     Returns:
         List of work items matching the query
@@ -848,7 +854,8 @@ async def execute_query_by_id(
 
     results = await workitem_service.execute_query_by_id(
         query_id=query_id,
-        limit=limit
+        limit=limit,
+        force_refresh=force_refresh
     )
 
     await ctx.info(f"Query returned {len(results)} work items")
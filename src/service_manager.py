@@ -2,7 +2,7 @@
 Service Manager for handling multiple Azure DevOps projects
 Provides lazy-loading service instances with caching per project
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from .services.sprint_service import SprintService
 from .services.workitem_service import WorkItemService
 from .auth import AzureDevOpsAuth
@@ -113,6 +113,34 @@ class ServiceManager:
 
         return service
 
+    def prewarm(self, projects: Iterable[str]) -> int:
+        """
+        Create sprint and work item services for several projects up front
+
+        Projects that already have a service are skipped and do not count
+        as cache hits.
+
+        Args:
+            projects: Azure DevOps project names to load
+
+        Returns:
+            Number of service instances created
+        """
+        created = 0
+        for project in projects:
+            project = self._resolve_project(project)
+
+            if project not in self._sprint_services:
+                self._sprint_services[project] = SprintService(self.auth, project)
+                created += 1
+
+            if project not in self._workitem_services:
+                self._workitem_services[project] = WorkItemService(self.auth, project)
+                created += 1
+
+        self._service_creation_count += created
+        return created
+
     def _resolve_project(self, project: Optional[str]) -> str:
         """
         Resolve project name, using default if not specified
@@ -133,9 +161,9 @@ class ServiceManager:
             return self.default_project
 
         raise ValidationError(
-            "project",
             "Project name is required. Either specify project parameter or set "
-            "AZURE_DEVOPS_PROJECT environment variable as default."
+            "AZURE_DEVOPS_PROJECT environment variable as default.",
+            field_name="project"
         )
 
     def get_loaded_projects(self) -> List[str]:
@@ -168,6 +196,14 @@ class ServiceManager:
         self._sprint_services.clear()
         self._workitem_services.clear()
 
+    def reset_statistics(self) -> None:
+        """
+        Reset service creation and cache hit counters
+        Cached service instances are left untouched
+        """
+        self._service_creation_count = 0
+        self._cache_hit_count = 0
+
     def get_statistics(self) -> Dict[str, any]:
         """
         Get service manager statistics
@@ -189,7 +225,7 @@ class ServiceManager:
         )
 
         return {
-            "loaded_projects": len(self.get_loaded_projects()),
+            "loaded_projects": len(self._sprint_services.keys() | self._workitem_services.keys()),
             "sprint_services": len(self._sprint_services),
             "workitem_services": len(self._workitem_services),
             "total_services": len(self._sprint_services) + len(self._workitem_services),
@@ -201,9 +237,10 @@ class ServiceManager:
 
     def __repr__(self) -> str:
         """String representation for debugging"""
-        stats = self.get_statistics()
+        projects = len(self._sprint_services.keys() | self._workitem_services.keys())
+        services = len(self._sprint_services) + len(self._workitem_services)
         return (
-            f"ServiceManager(projects={stats['loaded_projects']}, "
-            f"services={stats['total_services']}, "
+            f"ServiceManager(projects={projects}, "
+            f"services={services}, "
             f"default='{self.default_project}')"
         )
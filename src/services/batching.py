@@ -0,0 +1,54 @@
+"""
+Batched work item retrieval shared by the Azure DevOps services
+Splits large ID lists to respect the API's per-request batch size
+"""
+import asyncio
+from typing import List, Any
+
+from ..constants import QueryLimits
+from ..errors import QueryTooLargeError
+
+
+async def get_work_items_batched(wit_client, ids: List[int], **kwargs) -> List[Any]:
+    """
+    Fetch work items in chunks of QueryLimits.BATCH_SIZE.
+
+    When more than one chunk is needed, the chunks are requested
+    concurrently and the results are returned in the order of ``ids``.
+
+    Args:
+        wit_client: Work item tracking client
+        ids: List of work item IDs
+        **kwargs: Passed through to get_work_items (fields, expand)
+
+    Returns:
+        List of work items
+
+    Raises:
+        QueryTooLargeError: If more than MAX_LIMIT IDs requested
+    """
+    if len(ids) > QueryLimits.MAX_LIMIT:
+        raise QueryTooLargeError(
+            result_count=len(ids),
+            max_results=QueryLimits.MAX_LIMIT
+        )
+
+    if not ids:
+        return []
+
+    # Single batch: call inline, no thread hand-off needed
+    if len(ids) <= QueryLimits.BATCH_SIZE:
+        return list(wit_client.get_work_items(ids=ids, **kwargs))
+
+    # The SDK client is synchronous, so each chunk runs in a worker thread
+    batches = await asyncio.gather(*(
+        asyncio.to_thread(
+            wit_client.get_work_items,
+            ids=ids[i:i + QueryLimits.BATCH_SIZE],
+            **kwargs
+        )
+        for i in range(0, len(ids), QueryLimits.BATCH_SIZE)
+    ))
+
+    # gather preserves argument order, so items come back in ID order
+    return [item for batch_items in batches for item in batch_items]
@@ -4,6 +4,7 @@ Handles sprint board and iteration management
 """
 import sys
 from typing import List, Dict, Any, Optional
+from operator import attrgetter
 from azure.devops.v7_1.work_item_tracking.models import Wiql
 from azure.devops.v7_1.work.models import TeamContext
 from datetime import datetime, timezone
@@ -24,6 +25,10 @@ from ..constants import (
     fields_to_string
 )
 from ..cache import CachedService
+from .batching import get_work_items_batched
+
+# C-level accessor for pulling IDs out of WIQL work item references
+_GET_ID = attrgetter('id')
 
 
 class SprintService(CachedService):
@@ -224,12 +229,13 @@ ORDER BY [System.CreatedDate] DESC"""
         work_items = []
         if query_result.work_items:
             # Get work item IDs
-            ids = [item.id for item in query_result.work_items]
+            ids = list(map(_GET_ID, query_result.work_items))
 
             # Fetch work items with expand='All' to get all fields
-            work_items_full = self.wit_client.get_work_items(
-                ids=ids,
-                expand='All'
+            work_items_full = await get_work_items_batched(
+                self.wit_client,
+                ids,
+                expand=ExpandOptions.ALL
             )
 
             work_items = [
@@ -344,8 +350,9 @@ ORDER BY [System.CreatedDate] DESC"""
             return []
 
         # Fetch work items
-        work_items = self.wit_client.get_work_items(
-            ids=ids,
+        work_items = await get_work_items_batched(
+            self.wit_client,
+            ids,
             fields=fields_to_string(SPRINT_FIELDS)
         )
 
@@ -580,7 +587,7 @@ ORDER BY [System.CreatedDate] DESC"""
             team_name = teams[0].name
 
         return TeamContext(project=self.project, team=team_name)
-    
+
     @staticmethod
     def _format_work_item(wi) -> Dict[str, Any]:
         """Format work item for response"""
@@ -2,20 +2,21 @@
 Work Item service for Azure DevOps operations
 Handles CRUD operations for work items
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+from itertools import islice
+from operator import attrgetter
 from azure.devops.v7_1.work_item_tracking.models import (
     JsonPatchOperation,
     Wiql,
     CommentCreate
 )
 from azure.devops.v7_1.work.models import TeamContext
-from datetime import datetime
 
 from ..validation import (
     validate_state,
     validate_work_item_type,
     validate_field_name,
-    validate_field_value,
+    validate_fields_batch,
     validate_wiql,
     validate_iteration_path,
     validate_priority,
@@ -33,11 +34,25 @@ from ..constants import (
     fields_to_string
 )
 from ..cache import CachedService
+from .batching import get_work_items_batched
+
+# Pre-joined field list for the hot "my work items" fetch paths
+_MY_WORK_ITEMS_FIELDS_CSV = fields_to_string(MY_WORK_ITEMS_FIELDS)
+
+# C-level accessor for pulling IDs out of WIQL work item references
+_GET_ID = attrgetter('id')
 
 
 class WorkItemService(CachedService):
     """Service for work item operations with caching support"""
 
+    # Short TTL for saved-query result IDs so polling callers share results
+    WIQL_RESULT_CACHE_TTL = 5
+
+    # Saved-query WIQL text can be edited outside this server; keep it only
+    # briefly so edits show up without a force_refresh
+    QUERY_WIQL_CACHE_TTL = 30
+
     def __init__(self, auth, project: str):
         """
         Initialize work item service
@@ -82,12 +97,12 @@ class WorkItemService(CachedService):
             ValidationError: If state or work_item_type is invalid
         """
         # Validate inputs
-        if state:
-            state = validate_state(state)
-
         if work_item_type:
             work_item_type = validate_work_item_type(work_item_type)
 
+        if state:
+            state = validate_state(state, work_item_type)
+
         # Ensure limit doesn't exceed maximum
         limit = min(limit, QueryLimits.MAX_LIMIT)
 
@@ -117,12 +132,12 @@ AND [System.AssignedTo] = @Me"""
             return []
 
         # Get work item IDs
-        ids = [item.id for item in query_result.work_items]
+        ids = list(map(_GET_ID, query_result.work_items))
 
         # Fetch work items with optimized field selection (70% smaller than expand='All')
-        work_items = self.wit_client.get_work_items(
-            ids=ids,
-            fields=fields_to_string(MY_WORK_ITEMS_FIELDS)
+        work_items = await self._batch_get_work_items(
+            ids,
+            fields=_MY_WORK_ITEMS_FIELDS_CSV
         )
 
         # Format response
@@ -210,16 +225,13 @@ AND [System.AssignedTo] = @Me"""
         Raises:
             ValidationError: If field names are invalid
         """
+        # Validate field names and values (type checking, XSS prevention, etc.)
+        validated_fields = validate_fields_batch(fields)
+
         # Build patch document
         patch_document = []
 
-        for field_name, value in fields.items():
-            # Validate field name
-            validate_field_name(field_name)
-
-            # Validate field value (type checking, XSS prevention, etc.)
-            validated_value = validate_field_value(field_name, value)
-
+        for field_name, validated_value in validated_fields.items():
             # Ensure field name has proper format
             if not field_name.startswith('/fields/'):
                 field_path = f'/fields/{field_name}'
@@ -378,7 +390,7 @@ AND [System.AssignedTo] = @Me"""
     async def _batch_get_work_items(
         self,
         ids: List[int],
-        fields: Optional[List[str]] = None,
+        fields: Optional[Union[List[str], str]] = None,
         expand: str = ExpandOptions.NONE
     ) -> List[Any]:
         """
@@ -386,7 +398,8 @@ AND [System.AssignedTo] = @Me"""
 
         Args:
             ids: List of work item IDs
-            fields: Fields to retrieve (defaults to DETAILED_FIELDS)
+            fields: Fields to retrieve, as a list or pre-joined comma-separated
+                string (defaults to DETAILED_FIELDS)
             expand: Expand option
 
         Returns:
@@ -395,33 +408,19 @@ AND [System.AssignedTo] = @Me"""
         Raises:
             QueryTooLargeError: If more than MAX_LIMIT IDs requested
         """
-        from ..errors import QueryTooLargeError
-
-        if len(ids) > QueryLimits.MAX_LIMIT:
-            raise QueryTooLargeError(
-                result_count=len(ids),
-                max_results=QueryLimits.MAX_LIMIT
-            )
-
         # Use default fields if not specified
         if fields is None:
             fields = DETAILED_FIELDS
 
-        all_items = []
-
-        # Batch process in chunks of BATCH_SIZE (200)
-        for i in range(0, len(ids), QueryLimits.BATCH_SIZE):
-            batch_ids = ids[i:i + QueryLimits.BATCH_SIZE]
+        # Join once rather than per batch
+        fields_csv = fields if isinstance(fields, str) else fields_to_string(fields)
 
-            batch_items = self.wit_client.get_work_items(
-                ids=batch_ids,
-                fields=fields_to_string(fields),
-                expand=expand
-            )
-
-            all_items.extend(batch_items)
-
-        return all_items
+        return await get_work_items_batched(
+            self.wit_client,
+            ids,
+            fields=fields_csv,
+            expand=expand
+        )
 
     @azure_devops_operation(timeout_seconds=60, max_retries=3)
     async def get_work_item_hierarchy(
@@ -585,8 +584,6 @@ AND [System.AssignedTo] = @Me"""
         Returns:
             List of matching work items
         """
-        from ..validation import validate_field_name
-
         # Validate inputs
         validate_field_name(field)
 
@@ -594,7 +591,7 @@ AND [System.AssignedTo] = @Me"""
             work_item_type = validate_work_item_type(work_item_type)
 
         if state:
-            state = validate_state(state)
+            state = validate_state(state, work_item_type)
 
         # Ensure limit doesn't exceed maximum
         limit = min(limit, QueryLimits.MAX_LIMIT)
@@ -630,12 +627,12 @@ AND [System.AssignedTo] = @Me"""
             return []
 
         # Get work item IDs
-        ids = [item.id for item in query_result.work_items]
+        ids = list(map(_GET_ID, query_result.work_items))
 
         # Fetch work items
         work_items = await self._batch_get_work_items(
             ids,
-            fields=MY_WORK_ITEMS_FIELDS,
+            fields=_MY_WORK_ITEMS_FIELDS_CSV,
             expand=ExpandOptions.NONE
         )
 
@@ -702,12 +699,12 @@ AND [System.AssignedTo] = @Me"""
             return []
 
         # Get work item IDs
-        ids = [item.id for item in query_result.work_items]
+        ids = list(map(_GET_ID, query_result.work_items))
 
         # Fetch work items
         work_items = await self._batch_get_work_items(
             ids,
-            fields=MY_WORK_ITEMS_FIELDS,
+            fields=_MY_WORK_ITEMS_FIELDS_CSV,
             expand=ExpandOptions.NONE
         )
 
@@ -912,7 +909,7 @@ AND [System.AssignedTo] = @Me"""
         # Fetch full details of linked work items
         work_items = await self._batch_get_work_items(
             linked_ids,
-            fields=MY_WORK_ITEMS_FIELDS,
+            fields=_MY_WORK_ITEMS_FIELDS_CSV,
             expand=ExpandOptions.NONE
         )
 
@@ -947,7 +944,12 @@ AND [System.AssignedTo] = @Me"""
             max_batch_size: Maximum number of items per batch (default: 200)
 
         Returns:
-            List of updated work items
+            List of updated work items, one per distinct work item ID in
+            order of first appearance (not one per update entry). Updates
+            that repeat an ID are merged into a single write: field values
+            from later entries win, and their comments are joined with
+            newlines in order. A failed write yields an entry with 'id',
+            'error' and 'success': False in that item's position.
 
         Raises:
             ValidationError: If batch size exceeds maximum or updates are invalid
@@ -969,19 +971,29 @@ AND [System.AssignedTo] = @Me"""
                 f"Batch size {len(updates)} exceeds maximum {max_batch_size}"
             )
 
-        # Validate all updates have required fields
+        # Validate and coalesce in a single pass before any write, so each
+        # work item is written once (later field values win, comments are
+        # concatenated)
+        merged: Dict[int, Dict[str, Any]] = {}
         for idx, update in enumerate(updates):
             if 'id' not in update:
                 raise ValidationError(f"Update at index {idx} missing 'id' field")
             if 'fields' not in update:
                 raise ValidationError(f"Update at index {idx} missing 'fields' field")
+            entry = merged.setdefault(
+                update['id'],
+                {'id': update['id'], 'fields': {}, 'comments': []}
+            )
+            entry['fields'].update(update['fields'])
+            if update.get('comment'):
+                entry['comments'].append(update['comment'])
 
-        # Process each update
-        results = []
-        for update in updates:
+        # Process each update, writing results by position
+        results: List[Optional[Dict[str, Any]]] = [None] * len(merged)
+        for idx, update in enumerate(merged.values()):
             work_item_id = update['id']
             fields = update['fields']
-            comment = update.get('comment')
+            comment = '\n'.join(update['comments']) or None
 
             # Use existing update method
             try:
@@ -990,14 +1002,14 @@ AND [System.AssignedTo] = @Me"""
                     fields=fields,
                     comment=comment
                 )
-                results.append(result)
+                results[idx] = result
             except Exception as e:
                 # Include error in results
-                results.append({
+                results[idx] = {
                     'id': work_item_id,
                     'error': str(e),
                     'success': False
-                })
+                }
 
         return results
 
@@ -1048,19 +1060,19 @@ AND [System.AssignedTo] = @Me"""
                 f"Batch size {len(children)} exceeds maximum {max_batch_size}"
             )
 
-        # Validate parent exists
-        _ = await self.get_work_item(parent_id, include_comments=False)
-
-        # Validate all children have required fields
+        # Validate all children have required fields (before any API call)
         for idx, child in enumerate(children):
             if 'title' not in child:
                 raise ValidationError(f"Child at index {idx} missing 'title' field")
             if 'work_item_type' not in child:
                 raise ValidationError(f"Child at index {idx} missing 'work_item_type' field")
 
-        # Create each child work item
-        results = []
-        for child in children:
+        # Validate parent exists
+        _ = await self.get_work_item(parent_id, include_comments=False)
+
+        # Create each child work item, writing results by position
+        results: List[Optional[Dict[str, Any]]] = [None] * len(children)
+        for idx, child in enumerate(children):
             try:
                 # Create the child work item
                 created = await self.create_work_item(
@@ -1083,15 +1095,15 @@ AND [System.AssignedTo] = @Me"""
                 # Add parent_id to result for reference
                 created['parent_id'] = parent_id
                 created['success'] = True
-                results.append(created)
+                results[idx] = created
 
             except Exception as e:
                 # Include error in results
-                results.append({
+                results[idx] = {
                     'title': child['title'],
                     'error': str(e),
                     'success': False
-                })
+                }
 
         return results
 
@@ -1124,19 +1136,21 @@ AND [System.AssignedTo] = @Me"""
             top=top
         )
 
-        # Format revisions
+        # Format revisions (helpers bound locally; items can have hundreds)
+        format_identity = self._format_identity
+        format_date = self._format_date
         result = []
         for rev in revisions:
             fields = rev.fields or {}
             result.append({
                 'id': rev.id,
                 'rev': rev.rev,
-                'changed_by': self._format_identity(fields.get('System.ChangedBy')),
-                'changed_date': self._format_date(fields.get('System.ChangedDate')),
+                'changed_by': format_identity(fields.get('System.ChangedBy')),
+                'changed_date': format_date(fields.get('System.ChangedDate')),
                 'state': fields.get('System.State'),
                 'title': fields.get('System.Title'),
                 'work_item_type': fields.get('System.WorkItemType'),
-                'assigned_to': self._format_identity(fields.get('System.AssignedTo')),
+                'assigned_to': format_identity(fields.get('System.AssignedTo')),
                 'iteration_path': fields.get('System.IterationPath'),
                 'reason': fields.get('System.Reason')
             })
@@ -1179,10 +1193,10 @@ AND [System.AssignedTo] = @Me"""
             result.append({
                 'id': comment.id,
                 'text': comment.text,
-                'created_by': self._format_identity(comment.created_by) if hasattr(comment, 'created_by') else None,
-                'created_date': self._format_date(comment.created_date) if hasattr(comment, 'created_date') else None,
-                'modified_by': self._format_identity(comment.modified_by) if hasattr(comment, 'modified_by') else None,
-                'modified_date': self._format_date(comment.modified_date) if hasattr(comment, 'modified_date') else None
+                'created_by': self._format_identity(getattr(comment, 'created_by', None)),
+                'created_date': self._format_date(getattr(comment, 'created_date', None)),
+                'modified_by': self._format_identity(getattr(comment, 'modified_by', None)),
+                'modified_date': self._format_date(getattr(comment, 'modified_date', None))
             })
 
         return result
@@ -1231,8 +1245,9 @@ AND [System.AssignedTo] = @Me"""
                     'always_required': field.always_required if hasattr(field, 'always_required') else False,
                     'help_text': field.help_text if hasattr(field, 'help_text') else None
                 }
-                for field in (wit_type.field_instances or [])
-            ][:20]  # Limit to first 20 fields for readability
+                # Limit to first 20 fields for readability
+                for field in islice(wit_type.field_instances or (), 20)
+            ]
         }
 
     @azure_devops_operation(timeout_seconds=30, max_retries=3)
@@ -1279,14 +1294,22 @@ AND [System.AssignedTo] = @Me"""
     async def execute_query_by_id(
         self,
         query_id: str,
-        limit: int = QueryLimits.DEFAULT_LIMIT
+        limit: int = QueryLimits.DEFAULT_LIMIT,
+        force_refresh: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Execute a saved query and return results.
 
+        The matching work item IDs are cached for WIQL_RESULT_CACHE_TTL
+        seconds, so repeated calls for the same query skip re-running the
+        WIQL; work item details are always fetched fresh. The query's WIQL
+        text is cached for QUERY_WIQL_CACHE_TTL seconds so a cold execution
+        needs one round trip instead of two.
+
         Args:
             query_id: Query ID or path
             limit: Maximum number of results to return
+            force_refresh: Bypass the cached query result IDs and WIQL text
 
         Returns:
             List of work items matching the query
@@ -1294,28 +1317,44 @@ AND [System.AssignedTo] = @Me"""
         Raises:
             NotFoundError: If query doesn't exist
         """
-        # Get and validate query
-        query = await self.get_query(query_id, depth=1)
+        cache_key_parts = ('wiql_ids', query_id, limit)
+        ids = None if force_refresh else self._get_cached(*cache_key_parts)
+
+        if ids is None:
+            # Reuse recently fetched WIQL text and only pay the execution
+            # round trip
+            wiql_text = None if force_refresh else self._get_cached('query_wiql', query_id)
+
+            if wiql_text is None:
+                # Get and validate query
+                query = await self.get_query(query_id, depth=1)
+
+                if not query.get('wiql'):
+                    from ..errors import ValidationError
+                    raise ValidationError(f"Query '{query_id}' is a folder or has no WIQL")
+
+                wiql_text = query['wiql']
+                self._set_cached(
+                    wiql_text, 'query_wiql', query_id,
+                    ttl=self.QUERY_WIQL_CACHE_TTL
+                )
 
-        if not query.get('wiql'):
-            from ..errors import ValidationError
-            raise ValidationError(f"Query '{query_id}' is a folder or has no WIQL")
+            # Execute query
+            from azure.devops.v7_1.work_item_tracking.models import Wiql
+            wiql = Wiql(query=wiql_text)
+            query_result = self.wit_client.query_by_wiql(wiql, project=self.project)
 
-        # Execute query
-        from azure.devops.v7_1.work_item_tracking.models import Wiql
-        wiql = Wiql(query=query['wiql'])
-        query_result = self.wit_client.query_by_wiql(wiql, project=self.project)
+            # Get work item IDs
+            ids = list(map(_GET_ID, islice(query_result.work_items or (), limit)))
+            self._set_cached(ids, *cache_key_parts, ttl=self.WIQL_RESULT_CACHE_TTL)
 
-        if not query_result.work_items:
+        if not ids:
             return []
 
-        # Get work item IDs
-        ids = [item.id for item in query_result.work_items[:limit]]
-
         # Fetch work items
         work_items = await self._batch_get_work_items(
             ids,
-            fields=MY_WORK_ITEMS_FIELDS,
+            fields=_MY_WORK_ITEMS_FIELDS_CSV,
             expand=ExpandOptions.NONE
         )
 
@@ -1348,15 +1387,15 @@ AND [System.AssignedTo] = @Me"""
         """Format identity field"""
         if not identity:
             return None
-        if isinstance(identity, dict):
+        try:
             return identity.get('displayName') or identity.get('uniqueName')
-        return str(identity)
+        except AttributeError:
+            return str(identity)
     
     @staticmethod
     def _format_date(date) -> Optional[str]:
         """Format date field"""
         if not date:
             return None
-        if isinstance(date, datetime):
-            return date.isoformat()
-        return str(date)
+        isoformat = getattr(date, 'isoformat', None)
+        return isoformat() if isoformat else str(date)
@@ -6,16 +6,50 @@ and ensure data integrity for Azure DevOps API operations.
 """
 
 import re
-from typing import Optional, List, Set, Any
+import sys
+from functools import lru_cache
+from typing import Optional, List, Dict, FrozenSet, Any, Callable, Mapping, Tuple
 
 
 class ValidationError(Exception):
-    """Raised when input validation fails."""
-    pass
+    """
+    Raised when input validation fails.
+
+    The message may be a str.format template with positional arguments;
+    it is only formatted when the error is rendered, so raise sites that
+    are caught and discarded never pay for building the message.
+
+    Args:
+        message: Error message or format template
+        *args: Positional arguments for the template
+        field_name: Optional field the error refers to
+        allowed_values: Optional list of accepted values
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *args: Any,
+        field_name: Optional[str] = None,
+        allowed_values: Optional[List[Any]] = None
+    ):
+        super().__init__(message, *args)
+        self.message = message
+        self.format_args = args
+        self.field_name = field_name
+        self.allowed_values = allowed_values
+
+    def __str__(self) -> str:
+        text = self.message.format(*self.format_args) if self.format_args else self.message
+        if self.field_name:
+            text = f"{text} (field: {self.field_name})"
+        if self.allowed_values:
+            text = f"{text}. Allowed values: {', '.join(map(str, self.allowed_values))}"
+        return text
 
 
 # Azure DevOps work item states (comprehensive list)
-ALLOWED_STATES: Set[str] = {
+ALLOWED_STATES: FrozenSet[str] = frozenset(map(sys.intern, {
     # Common states across all work item types
     'New',
     'Active',
@@ -44,11 +78,48 @@ ALLOWED_STATES: Set[str] = {
     'To Do',
     'In Planning',
     'Cut',
+}))
+
+
+# States added by customized (inherited) processes; accepted for every type
+_CUSTOM_PROCESS_STATES: FrozenSet[str] = frozenset(map(sys.intern, {
+    'Ready',
+    'In Review',
+    'Completed',
+    'In Planning',
+    'Cut',
+}))
+
+# Default-process states per work item type (union across Agile, Scrum,
+# CMMI and Basic). Types not listed here are checked against ALLOWED_STATES.
+STATES_BY_WORK_ITEM_TYPE: Dict[str, FrozenSet[str]] = {
+    sys.intern(work_item_type): frozenset(map(sys.intern, states)) | _CUSTOM_PROCESS_STATES
+    for work_item_type, states in {
+        'User Story': {'New', 'Active', 'Resolved', 'Closed', 'Removed'},
+        'Product Backlog Item': {'New', 'Approved', 'Committed', 'Done', 'Removed'},
+        'Requirement': {'Proposed', 'Active', 'Resolved', 'Closed', 'Removed'},
+        'Task': {
+            'New', 'Active', 'Resolved', 'Closed', 'Removed',
+            'Proposed', 'To Do', 'In Progress', 'Done',
+        },
+        'Bug': {
+            'New', 'Active', 'Resolved', 'Closed', 'Removed',
+            'Proposed', 'Approved', 'Committed', 'Done',
+        },
+        'Feature': {
+            'New', 'Active', 'Resolved', 'Closed', 'Removed',
+            'Proposed', 'In Progress', 'Done',
+        },
+        'Epic': {
+            'New', 'Active', 'Resolved', 'Closed', 'Removed',
+            'Proposed', 'In Progress', 'To Do', 'Done',
+        },
+    }.items()
 }
 
 
 # Azure DevOps work item types (comprehensive list)
-ALLOWED_WORK_ITEM_TYPES: Set[str] = {
+ALLOWED_WORK_ITEM_TYPES: FrozenSet[str] = frozenset(map(sys.intern, {
     # Agile
     'User Story',
     'Task',
@@ -77,11 +148,11 @@ ALLOWED_WORK_ITEM_TYPES: Set[str] = {
     'Shared Parameter',
     'Test Plan',
     'Test Suite',
-}
+}))
 
 
 # Azure DevOps field reference names (comprehensive list)
-ALLOWED_FIELD_NAMES: Set[str] = {
+ALLOWED_FIELD_NAMES: FrozenSet[str] = frozenset(map(sys.intern, {
     # System fields
     'System.Id',
     'System.Rev',
@@ -170,11 +241,11 @@ ALLOWED_FIELD_NAMES: Set[str] = {
     'Microsoft.VSTS.TCM.AutomatedTestStorage',
     'Microsoft.VSTS.TCM.AutomatedTestId',
     'Microsoft.VSTS.TCM.AutomatedTestType',
-}
+}))
 
 
 # Link types for hierarchical queries
-ALLOWED_LINK_TYPES: Set[str] = {
+ALLOWED_LINK_TYPES: FrozenSet[str] = frozenset(map(sys.intern, {
     'System.LinkTypes.Hierarchy-Forward',
     'System.LinkTypes.Hierarchy-Reverse',
     'System.LinkTypes.Related',
@@ -188,36 +259,129 @@ ALLOWED_LINK_TYPES: Set[str] = {
     'System.LinkTypes.Parent',
     'System.LinkTypes.Affects',
     'System.LinkTypes.AffectedBy',
+}))
+
+
+# Lower-cased name -> canonical name, for case-insensitive whitelist lookups
+_STATES_BY_LOWER: Dict[str, str] = {state.lower(): state for state in ALLOWED_STATES}
+_WORK_ITEM_TYPES_BY_LOWER: Dict[str, str] = {
+    work_item_type.lower(): work_item_type for work_item_type in ALLOWED_WORK_ITEM_TYPES
+}
+
+# Whitelist name -> the interned whitelist entry itself. Probing with the raw
+# caller string and returning the stored entry hands back an interned name
+# without ever interning caller input
+_CANONICAL_NAMES: Dict[str, str] = {
+    name: name
+    for name in ALLOWED_STATES | ALLOWED_WORK_ITEM_TYPES
+    | ALLOWED_FIELD_NAMES | ALLOWED_LINK_TYPES
+}
+
+# Sorted whitelist listings for error messages (built once at import)
+_ALLOWED_STATES_STR = ', '.join(sorted(ALLOWED_STATES))
+_STATES_BY_WORK_ITEM_TYPE_STR: Dict[str, str] = {
+    work_item_type: ', '.join(sorted(states))
+    for work_item_type, states in STATES_BY_WORK_ITEM_TYPE.items()
 }
+_ALLOWED_WORK_ITEM_TYPES_STR = ', '.join(sorted(ALLOWED_WORK_ITEM_TYPES))
+_ALLOWED_LINK_TYPES_STR = ', '.join(sorted(ALLOWED_LINK_TYPES))
+_FIELD_NAMES_HINT = (
+    "Common fields: System.Id, System.Title, System.State, "
+    "Microsoft.VSTS.Common.Priority, Microsoft.VSTS.Scheduling.StoryPoints"
+)
+
+# Namespaces every whitelisted field reference name belongs to
+_ALLOWED_FIELD_PREFIXES = ('System.', 'Microsoft.VSTS.')
+
+# JSON-Patch path prefix that may precede a field reference name
+_FIELDS_PREFIX = '/fields/'
+_FIELDS_PREFIX_LEN = len(_FIELDS_PREFIX)
+
+# FROM WorkItems|WorkItemLinks and the SELECT keyword that must precede it,
+# matched case-insensitively. Kept as two searches: a single
+# SELECT.+?FROM pattern backtracks quadratically on repeated SELECTs
+_WIQL_FROM_TARGET_RE = re.compile(
+    r'\bFROM\s+(?:WorkItems|WorkItemLinks)\b',
+    re.IGNORECASE
+)
+_WIQL_SELECT_RE = re.compile(r'\bSELECT\b', re.IGNORECASE)
+# SELECT keyword, FROM keyword and FROM target in one alternation, used to
+# report which part of a query is missing
+_WIQL_CLAUSES_RE = re.compile(
+    r'\b(?:(SELECT)\b|FROM\b(?:\s+(WorkItems|WorkItemLinks)\b)?)',
+    re.IGNORECASE
+)
+_NON_BRACKET_RE = re.compile(r'[^\[\]]+')
+
+# Character escapes applied to WIQL string literals in a single pass
+_WIQL_ESCAPE_TABLE = str.maketrans({"'": "''"})
+
+# Path traversal sequences and WIQL-significant characters rejected in
+# iteration paths, matched in a single scan
+_ITERATION_PATH_REJECT_RE = re.compile(r'''\.\.|//|[;'"]''')
+
+# Separator between iteration path nodes
+_PATH_SEP = '\\'
+
+# Dangerous HTML patterns rejected by sanitize_html_string
+_SCRIPT_TAG_RE = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+_JS_PROTOCOL_RE = re.compile(r'javascript:', re.IGNORECASE)
+_EVENT_HANDLER_RE = re.compile(r'\son\w+\s*=', re.IGNORECASE)
 
 
 class StateValidator:
     """Validator for work item states."""
 
     @staticmethod
-    def validate(state: str) -> str:
+    def validate(state: str, work_item_type: Optional[str] = None) -> str:
         """
-        Validate work item state against whitelist.
+        Validate work item state against whitelist (case-insensitive).
 
         Args:
             state: The state to validate
+            work_item_type: Optional work item type; when it has a known
+                state set (STATES_BY_WORK_ITEM_TYPE), the state is checked
+                against that narrower set
 
         Returns:
-            The validated state (unchanged)
+            The validated state in its canonical casing
 
         Raises:
             ValidationError: If state is not in whitelist
         """
+        # Resolve other casings of the type before picking its state set
+        if (
+            isinstance(work_item_type, str)
+            and work_item_type not in STATES_BY_WORK_ITEM_TYPE
+        ):
+            work_item_type = _WORK_ITEM_TYPES_BY_LOWER.get(
+                work_item_type.lower(), work_item_type
+            )
+        allowed = STATES_BY_WORK_ITEM_TYPE.get(work_item_type, ALLOWED_STATES)
+
+        # Success path is a single set lookup; '' and None fall through
+        if state in allowed:
+            return _CANONICAL_NAMES[state]
+
         if not state:
             raise ValidationError("State cannot be empty")
 
-        if state not in ALLOWED_STATES:
+        # Other casings resolve through the pre-lowered index
+        if isinstance(state, str):
+            canonical = _STATES_BY_LOWER.get(state.lower())
+            if canonical in allowed:
+                return canonical
+
+        if allowed is not ALLOWED_STATES:
             raise ValidationError(
-                f"Invalid state: '{state}'. "
-                f"Allowed states: {', '.join(sorted(ALLOWED_STATES))}"
+                "Invalid state for {0}: '{1}'. Allowed states: {2}",
+                work_item_type, state, _STATES_BY_WORK_ITEM_TYPE_STR[work_item_type]
             )
 
-        return state
+        raise ValidationError(
+            "Invalid state: '{0}'. Allowed states: {1}",
+            state, _ALLOWED_STATES_STR
+        )
 
 
 class WorkItemTypeValidator:
@@ -226,33 +390,40 @@ class WorkItemTypeValidator:
     @staticmethod
     def validate(work_item_type: str) -> str:
         """
-        Validate work item type against whitelist.
+        Validate work item type against whitelist (case-insensitive).
 
         Args:
             work_item_type: The work item type to validate
 
         Returns:
-            The validated work item type (unchanged)
+            The validated work item type in its canonical casing
 
         Raises:
             ValidationError: If work item type is not in whitelist
         """
+        if work_item_type in ALLOWED_WORK_ITEM_TYPES:
+            return _CANONICAL_NAMES[work_item_type]
+
         if not work_item_type:
             raise ValidationError("Work item type cannot be empty")
 
-        if work_item_type not in ALLOWED_WORK_ITEM_TYPES:
-            raise ValidationError(
-                f"Invalid work item type: '{work_item_type}'. "
-                f"Allowed types: {', '.join(sorted(ALLOWED_WORK_ITEM_TYPES))}"
-            )
+        # Other casings resolve through the pre-lowered index
+        if isinstance(work_item_type, str):
+            canonical = _WORK_ITEM_TYPES_BY_LOWER.get(work_item_type.lower())
+            if canonical is not None:
+                return canonical
 
-        return work_item_type
+        raise ValidationError(
+            "Invalid work item type: '{0}'. Allowed types: {1}",
+            work_item_type, _ALLOWED_WORK_ITEM_TYPES_STR
+        )
 
 
 class FieldNameValidator:
     """Validator for Azure DevOps field reference names."""
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def validate(field_name: str) -> str:
         """
         Validate field reference name against whitelist.
@@ -270,14 +441,21 @@ class FieldNameValidator:
             raise ValidationError("Field name cannot be empty")
 
         # Strip /fields/ prefix if present
-        clean_field_name = field_name.replace('/fields/', '')
-
-        if clean_field_name not in ALLOWED_FIELD_NAMES:
+        if field_name.startswith(_FIELDS_PREFIX):
+            clean_field_name = field_name[_FIELDS_PREFIX_LEN:]
+        else:
+            clean_field_name = field_name
+
+        # One C-level prefix check rejects names outside the whitelisted
+        # namespaces before the set lookup. The raw name is probed as-is:
+        # caller input is never interned
+        if (
+            not clean_field_name.startswith(_ALLOWED_FIELD_PREFIXES)
+            or clean_field_name not in ALLOWED_FIELD_NAMES
+        ):
             raise ValidationError(
-                f"Invalid field name: '{field_name}'. "
-                f"Field is not in the allowed list. "
-                f"Common fields: System.Id, System.Title, System.State, "
-                f"Microsoft.VSTS.Common.Priority, Microsoft.VSTS.Scheduling.StoryPoints"
+                "Invalid field name: '{0}'. Field is not in the allowed list. {1}",
+                field_name, _FIELD_NAMES_HINT
             )
 
         return field_name
@@ -300,22 +478,22 @@ class LinkTypeValidator:
         Raises:
             ValidationError: If link type is not in whitelist
         """
+        if link_type in ALLOWED_LINK_TYPES:
+            return _CANONICAL_NAMES[link_type]
+
         if not link_type:
             raise ValidationError("Link type cannot be empty")
 
-        if link_type not in ALLOWED_LINK_TYPES:
-            raise ValidationError(
-                f"Invalid link type: '{link_type}'. "
-                f"Allowed link types: {', '.join(sorted(ALLOWED_LINK_TYPES))}"
-            )
-
-        return link_type
+        raise ValidationError(
+            "Invalid link type: '{0}'. Allowed link types: {1}",
+            link_type, _ALLOWED_LINK_TYPES_STR
+        )
 
 
 class WiqlValidator:
     """Validator for WIQL (Work Item Query Language) queries."""
 
-    MAX_QUERY_LENGTH = 32000  # 32KB limit per Azure DevOps documentation
+    MAX_QUERY_LENGTH = 32768  # 32KB limit per Azure DevOps documentation
 
     @staticmethod
     def validate(query: str) -> str:
@@ -334,39 +512,104 @@ class WiqlValidator:
         if not query:
             raise ValidationError("WIQL query cannot be empty")
 
-        # Check length
-        if len(query) > WiqlValidator.MAX_QUERY_LENGTH:
+        # Check length first: oversized queries are rejected in O(1), before
+        # they are hashed for the structure cache or scanned by any regex
+        length = len(query)
+        if length > WiqlValidator.MAX_QUERY_LENGTH:
             raise ValidationError(
-                f"WIQL query exceeds maximum length of {WiqlValidator.MAX_QUERY_LENGTH} characters "
-                f"(current length: {len(query)})"
+                "WIQL query exceeds maximum length of {0} characters (current length: {1})",
+                WiqlValidator.MAX_QUERY_LENGTH, length
             )
 
-        # Check for required clauses
-        query_upper = query.upper()
+        return WiqlValidator._validate_structure(query)
 
-        if 'SELECT' not in query_upper:
-            raise ValidationError("WIQL query must contain SELECT clause")
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _validate_structure(query: str) -> str:
+        """
+        Validate the clauses and brackets of a non-empty, length-checked query.
 
-        if 'FROM' not in query_upper:
-            raise ValidationError("WIQL query must contain FROM clause")
+        Args:
+            query: The WIQL query to validate
 
-        # Check for valid FROM target
-        valid_targets = ['WORKITEMS', 'WORKITEMLINKS']
-        has_valid_target = any(target in query_upper for target in valid_targets)
+        Returns:
+            The validated query (unchanged)
+
+        Raises:
+            ValidationError: If query structure is invalid
+        """
+        # Check for required clauses: a FROM-target search plus a SELECT
+        # search bounded to the text before it, both linear; the keyword
+        # scan only runs to explain a failure
+        from_target = _WIQL_FROM_TARGET_RE.search(query)
+        if (
+            from_target is None
+            or _WIQL_SELECT_RE.search(query, 0, from_target.start()) is None
+        ):
+            has_select, has_from, has_valid_from = WiqlValidator._scan_clauses(query)
+
+            if not has_select:
+                raise ValidationError("WIQL query must contain SELECT clause")
+
+            if not has_from:
+                raise ValidationError("WIQL query must contain FROM clause")
+
+            if has_valid_from:
+                raise ValidationError("WIQL query SELECT clause must come before FROM")
 
-        if not has_valid_target:
             raise ValidationError(
                 "WIQL query FROM clause must specify 'WorkItems' or 'WorkItemLinks'"
             )
 
         # Check for balanced brackets
-        if not WiqlValidator._check_balanced_brackets(query):
+        if not WiqlValidator._has_balanced_brackets(query):
             raise ValidationError("WIQL query has unbalanced square brackets")
 
         return query
 
     @staticmethod
-    def _check_balanced_brackets(query: str) -> bool:
+    def _scan_clauses(query: str) -> Tuple[bool, bool, bool]:
+        """
+        Find the SELECT keyword, FROM keyword and a valid FROM target.
+
+        The query is scanned once with a single case-insensitive pattern,
+        stopping as soon as all three have been seen.
+
+        Args:
+            query: The query to scan
+
+        Returns:
+            (has_select, has_from, has_valid_from) flags
+        """
+        has_select = has_from = has_valid_from = False
+        for match in _WIQL_CLAUSES_RE.finditer(query):
+            if match.group(1):
+                has_select = True
+            else:
+                has_from = True
+                if match.group(2):
+                    has_valid_from = True
+            if has_select and has_valid_from:
+                break
+        return has_select, has_from, has_valid_from
+
+    @staticmethod
+    def _has_select_clause(query: str) -> bool:
+        """Check whether the query contains a SELECT keyword."""
+        return WiqlValidator._scan_clauses(query)[0]
+
+    @staticmethod
+    def _has_from_clause(query: str) -> bool:
+        """Check whether the query contains a FROM keyword."""
+        return WiqlValidator._scan_clauses(query)[1]
+
+    @staticmethod
+    def _has_valid_from_clause(query: str) -> bool:
+        """Check whether FROM targets WorkItems or WorkItemLinks."""
+        return WiqlValidator._scan_clauses(query)[2]
+
+    @staticmethod
+    def _has_balanced_brackets(query: str) -> bool:
         """
         Check if square brackets are balanced in the query.
 
@@ -376,15 +619,26 @@ class WiqlValidator:
         Returns:
             True if balanced, False otherwise
         """
-        count = 0
-        for char in query:
-            if char == '[':
-                count += 1
-            elif char == ']':
-                count -= 1
-            if count < 0:
+        # Cheap C-level count comparison rejects most unbalanced queries
+        opens = query.count('[')
+        if opens != query.count(']'):
+            return False
+        if not opens:
+            return True
+
+        # Equal counts: check ordering on the bracket-only skeleton. WIQL
+        # brackets don't nest, so a well-formed query is just '[]' repeated
+        brackets = _NON_BRACKET_RE.sub('', query)
+        if brackets == '[]' * opens:
+            return True
+
+        # Nested brackets: single depth-tracking pass over the skeleton
+        depth = 0
+        for char in brackets:
+            depth += 1 if char == '[' else -1
+            if depth < 0:
                 return False
-        return count == 0
+        return True
 
     @staticmethod
     def sanitize_string_literal(value: str) -> str:
@@ -402,14 +656,19 @@ class WiqlValidator:
         if value is None:
             return None
 
+        # Most literals contain no quote; return them without copying
+        if "'" not in value:
+            return value
+
         # Escape single quotes (SQL-style escaping)
-        return value.replace("'", "''")
+        return value.translate(_WIQL_ESCAPE_TABLE)
 
 
 class IterationPathValidator:
     """Validator for iteration paths."""
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def validate(iteration_path: str, project: str) -> str:
         """
         Validate and normalize iteration path.
@@ -432,24 +691,31 @@ class IterationPathValidator:
         if not project:
             raise ValidationError("Project name is required for iteration path validation")
 
-        # Check for injection attempts (basic path traversal)
-        if '..' in iteration_path or '//' in iteration_path:
+        # Check for injection attempts (path traversal, quotes, semicolons)
+        rejected = _ITERATION_PATH_REJECT_RE.search(iteration_path)
+        if rejected:
+            if rejected.group() in ('..', '//'):
+                raise ValidationError(
+                    "Invalid iteration path: '{0}'. Path traversal characters not allowed.",
+                    iteration_path
+                )
             raise ValidationError(
-                f"Invalid iteration path: '{iteration_path}'. "
-                "Path traversal characters not allowed."
+                "Invalid iteration path: '{0}'. Character {1!r} not allowed.",
+                iteration_path, rejected.group()
             )
 
-        # Auto-prefix with project name if not present
-        if not iteration_path.startswith(f'{project}\\'):
-            iteration_path = f'{project}\\{iteration_path}'
+        # Auto-prefix with project name unless this is the project root or
+        # already under it
+        if iteration_path == project or iteration_path.startswith(project + _PATH_SEP):
+            return iteration_path
 
-        return iteration_path
+        return f'{project}{_PATH_SEP}{iteration_path}'
 
 
 class PriorityValidator:
     """Validator for work item priority."""
 
-    ALLOWED_PRIORITIES = {1, 2, 3, 4}
+    ALLOWED_PRIORITIES: FrozenSet[int] = frozenset({1, 2, 3, 4})
 
     @staticmethod
     def validate(priority: int) -> int:
@@ -467,8 +733,8 @@ class PriorityValidator:
         """
         if priority not in PriorityValidator.ALLOWED_PRIORITIES:
             raise ValidationError(
-                f"Invalid priority: {priority}. "
-                f"Priority must be 1-4 (where 1 is highest)"
+                "Invalid priority: {0}. Priority must be 1-4 (where 1 is highest)",
+                priority
             )
 
         return priority
@@ -477,7 +743,7 @@ class PriorityValidator:
 class SeverityValidator:
     """Validator for bug severity."""
 
-    ALLOWED_SEVERITIES = {1, 2, 3, 4}
+    ALLOWED_SEVERITIES: FrozenSet[int] = frozenset({1, 2, 3, 4})
 
     @staticmethod
     def validate(severity: int) -> int:
@@ -495,8 +761,8 @@ class SeverityValidator:
         """
         if severity not in SeverityValidator.ALLOWED_SEVERITIES:
             raise ValidationError(
-                f"Invalid severity: {severity}. "
-                f"Severity must be 1-4 (where 1 is most severe)"
+                "Invalid severity: {0}. Severity must be 1-4 (where 1 is most severe)",
+                severity
             )
 
         return severity
@@ -504,14 +770,25 @@ class SeverityValidator:
 
 # Convenience functions for common validations
 
-def validate_state(state: Optional[str]) -> Optional[str]:
-    """Validate state if provided."""
-    return StateValidator.validate(state) if state else None
+# Validator entry points bound once so the optional-value wrappers below
+# skip the class attribute lookup on every call
+_validate_state = StateValidator.validate
+_validate_work_item_type = WorkItemTypeValidator.validate
+_validate_priority = PriorityValidator.validate
+_validate_severity = SeverityValidator.validate
+
+
+def validate_state(
+    state: Optional[str],
+    work_item_type: Optional[str] = None
+) -> Optional[str]:
+    """Validate state if provided, optionally for a specific work item type."""
+    return _validate_state(state, work_item_type) if state else None
 
 
 def validate_work_item_type(work_item_type: Optional[str]) -> Optional[str]:
     """Validate work item type if provided."""
-    return WorkItemTypeValidator.validate(work_item_type) if work_item_type else None
+    return _validate_work_item_type(work_item_type) if work_item_type else None
 
 
 def validate_field_name(field_name: str) -> str:
@@ -521,7 +798,19 @@ def validate_field_name(field_name: str) -> str:
 
 def validate_field_names(field_names: List[str]) -> List[str]:
     """Validate a list of field reference names."""
-    return [FieldNameValidator.validate(name) for name in field_names]
+    names = list(field_names)
+    cleaned = [
+        name[_FIELDS_PREFIX_LEN:] if name and name.startswith(_FIELDS_PREFIX) else name
+        for name in names
+    ]
+
+    # Single set check on the common all-valid path; only walk the list
+    # per name to report the first offender
+    if not ALLOWED_FIELD_NAMES.issuperset(cleaned):
+        for name in names:
+            FieldNameValidator.validate(name)
+
+    return names
 
 
 def validate_wiql(query: str) -> str:
@@ -541,12 +830,12 @@ def validate_iteration_path(iteration_path: str, project: str) -> str:
 
 def validate_priority(priority: Optional[int]) -> Optional[int]:
     """Validate priority if provided."""
-    return PriorityValidator.validate(priority) if priority is not None else None
+    return _validate_priority(priority) if priority is not None else None
 
 
 def validate_severity(severity: Optional[int]) -> Optional[int]:
     """Validate severity if provided."""
-    return SeverityValidator.validate(severity) if severity is not None else None
+    return _validate_severity(severity) if severity is not None else None
 
 
 def sanitize_wiql_string(value: str) -> str:
@@ -554,6 +843,90 @@ def sanitize_wiql_string(value: str) -> str:
     return WiqlValidator.sanitize_string_literal(value)
 
 
+# String fields that need HTML sanitization to prevent XSS
+_HTML_FIELDS: FrozenSet[str] = frozenset({
+    'System.Description',
+    'System.Title',
+    'Microsoft.VSTS.Common.AcceptanceCriteria',
+    'Microsoft.VSTS.TCM.ReproSteps'
+})
+
+# Numeric fields that must be non-negative numbers
+_NUMERIC_FIELDS: FrozenSet[str] = frozenset({
+    'Microsoft.VSTS.Scheduling.RemainingWork',
+    'Microsoft.VSTS.Scheduling.CompletedWork',
+    'Microsoft.VSTS.Scheduling.OriginalEstimate',
+    'Microsoft.VSTS.Scheduling.StoryPoints',
+    'Microsoft.VSTS.Scheduling.Effort',
+    'Microsoft.VSTS.Scheduling.Size',
+    'Microsoft.VSTS.Common.BusinessValue',
+    'Microsoft.VSTS.Common.StackRank',
+    'Microsoft.VSTS.Common.BacklogPriority'
+})
+
+
+def _validate_state_field(field_name: str, value: Any) -> Any:
+    """Validate a System.State value."""
+    if not isinstance(value, str):
+        raise ValidationError("System.State must be a string, got {0}", type(value).__name__)
+    return validate_state(value)
+
+
+def _validate_priority_field(field_name: str, value: Any) -> Any:
+    """Validate a Priority value."""
+    if not isinstance(value, int):
+        raise ValidationError("Priority must be an integer, got {0}", type(value).__name__)
+    return validate_priority(value)
+
+
+def _validate_severity_field(field_name: str, value: Any) -> Any:
+    """Validate a Severity value."""
+    if not isinstance(value, int):
+        raise ValidationError("Severity must be an integer, got {0}", type(value).__name__)
+    return validate_severity(value)
+
+
+def _validate_work_item_type_field(field_name: str, value: Any) -> Any:
+    """Validate a System.WorkItemType value."""
+    if not isinstance(value, str):
+        raise ValidationError("WorkItemType must be a string, got {0}", type(value).__name__)
+    return validate_work_item_type(value)
+
+
+def _validate_html_field(field_name: str, value: Any) -> Any:
+    """Validate and sanitize an HTML/string field value."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValidationError("{0} must be a string, got {1}", field_name, type(value).__name__)
+    # Basic HTML sanitization: escape dangerous characters
+    # Note: Azure DevOps has its own sanitization, but defense in depth is good
+    return sanitize_html_string(value)
+
+
+def _validate_numeric_field(field_name: str, value: Any) -> Any:
+    """Validate a non-negative numeric field value."""
+    if value is None:
+        return None
+    if not isinstance(value, (int, float)):
+        raise ValidationError("{0} must be a number, got {1}", field_name, type(value).__name__)
+    if value < 0:
+        raise ValidationError("{0} cannot be negative", field_name)
+    return value
+
+
+# Field reference name -> value validator, built once at import.
+# Iteration path validation requires project context and is handled separately.
+_FIELD_VALIDATORS: Dict[str, Callable[[str, Any], Any]] = {
+    'System.State': _validate_state_field,
+    'Microsoft.VSTS.Common.Priority': _validate_priority_field,
+    'Microsoft.VSTS.Common.Severity': _validate_severity_field,
+    'System.WorkItemType': _validate_work_item_type_field,
+    **dict.fromkeys(_HTML_FIELDS, _validate_html_field),
+    **dict.fromkeys(_NUMERIC_FIELDS, _validate_numeric_field),
+}
+
+
 def validate_field_value(field_name: str, value: Any) -> Any:
     """
     Validate a field value based on the field type.
@@ -571,74 +944,46 @@ def validate_field_value(field_name: str, value: Any) -> Any:
         ValidationError: If the value is invalid for the field
     """
     # Normalize field name
-    clean_field_name = field_name.replace('/fields/', '')
-
-    # State field validation
-    if clean_field_name == 'System.State':
-        if not isinstance(value, str):
-            raise ValidationError(f"System.State must be a string, got {type(value).__name__}")
-        return validate_state(value)
-
-    # Priority field validation
-    if clean_field_name == 'Microsoft.VSTS.Common.Priority':
-        if not isinstance(value, int):
-            raise ValidationError(f"Priority must be an integer, got {type(value).__name__}")
-        return validate_priority(value)
-
-    # Severity field validation
-    if clean_field_name == 'Microsoft.VSTS.Common.Severity':
-        if not isinstance(value, int):
-            raise ValidationError(f"Severity must be an integer, got {type(value).__name__}")
-        return validate_severity(value)
-
-    # Work item type validation
-    if clean_field_name == 'System.WorkItemType':
-        if not isinstance(value, str):
-            raise ValidationError(f"WorkItemType must be a string, got {type(value).__name__}")
-        return validate_work_item_type(value)
-
-    # Iteration path validation (requires project context, handled separately)
-    # String fields that need HTML sanitization to prevent XSS
-    html_fields = {
-        'System.Description',
-        'System.Title',
-        'Microsoft.VSTS.Common.AcceptanceCriteria',
-        'Microsoft.VSTS.TCM.ReproSteps'
-    }
-
-    if clean_field_name in html_fields:
-        if value is None:
-            return None
-        if not isinstance(value, str):
-            raise ValidationError(f"{clean_field_name} must be a string, got {type(value).__name__}")
-        # Basic HTML sanitization: escape dangerous characters
-        # Note: Azure DevOps has its own sanitization, but defense in depth is good
-        return sanitize_html_string(value)
-
-    # Numeric fields validation
-    numeric_fields = {
-        'Microsoft.VSTS.Scheduling.RemainingWork',
-        'Microsoft.VSTS.Scheduling.CompletedWork',
-        'Microsoft.VSTS.Scheduling.OriginalEstimate',
-        'Microsoft.VSTS.Scheduling.StoryPoints',
-        'Microsoft.VSTS.Scheduling.Effort',
-        'Microsoft.VSTS.Scheduling.Size',
-        'Microsoft.VSTS.Common.BusinessValue',
-        'Microsoft.VSTS.Common.StackRank',
-        'Microsoft.VSTS.Common.BacklogPriority'
-    }
-
-    if clean_field_name in numeric_fields:
-        if value is None:
-            return None
-        if not isinstance(value, (int, float)):
-            raise ValidationError(f"{clean_field_name} must be a number, got {type(value).__name__}")
-        if value < 0:
-            raise ValidationError(f"{clean_field_name} cannot be negative")
+    if field_name.startswith(_FIELDS_PREFIX):
+        clean_field_name = field_name[_FIELDS_PREFIX_LEN:]
+    else:
+        clean_field_name = field_name
+
+    handler = _FIELD_VALIDATORS.get(clean_field_name)
+    if handler is None:
+        # For other fields, return as-is (they're already validated by field name)
         return value
 
-    # For other fields, return as-is (they're already validated by field name)
-    return value
+    return handler(clean_field_name, value)
+
+
+def validate_fields_batch(fields: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a mapping of field reference names to values in one call.
+
+    Names are checked together against the whitelist (see
+    validate_field_names), then each value is dispatched to its field
+    validator.
+
+    Args:
+        fields: Field reference names (optionally '/fields/'-prefixed) to values
+
+    Returns:
+        Dictionary with the original names mapped to validated/sanitized values
+
+    Raises:
+        ValidationError: If any field name or value is invalid
+    """
+    names = validate_field_names(list(fields))
+
+    validated = {}
+    for name in names:
+        clean_name = name[_FIELDS_PREFIX_LEN:] if name.startswith(_FIELDS_PREFIX) else name
+        handler = _FIELD_VALIDATORS.get(clean_name)
+        value = fields[name]
+        validated[name] = value if handler is None else handler(clean_name, value)
+
+    return validated
 
 
 def sanitize_html_string(value: str, max_length: int = 100000) -> str:
@@ -664,11 +1009,13 @@ def sanitize_html_string(value: str, max_length: int = 100000) -> str:
     # Check length to prevent DoS
     if len(value) > max_length:
         raise ValidationError(
-            f"String too long: {len(value)} characters (max: {max_length})"
+            "String too long: {0} characters (max: {1})",
+            len(value), max_length
         )
 
-    # Remove null bytes
-    value = value.replace('\x00', '')
+    # Remove null bytes (rare; skip the copy when there are none)
+    if '\x00' in value:
+        value = value.replace('\x00', '')
 
     # Note: We don't escape HTML here because Azure DevOps expects
     # HTML content in description fields. Azure DevOps will handle
@@ -676,15 +1023,15 @@ def sanitize_html_string(value: str, max_length: int = 100000) -> str:
     # patterns and enforce length limits.
 
     # Block script tags (case-insensitive)
-    if re.search(r'<script[^>]*>.*?</script>', value, re.IGNORECASE | re.DOTALL):
+    if _SCRIPT_TAG_RE.search(value):
         raise ValidationError("Script tags are not allowed in HTML content")
 
     # Block javascript: protocol
-    if re.search(r'javascript:', value, re.IGNORECASE):
+    if _JS_PROTOCOL_RE.search(value):
         raise ValidationError("JavaScript protocol is not allowed")
 
     # Block on* event handlers
-    if re.search(r'\son\w+\s*=', value, re.IGNORECASE):
+    if _EVENT_HANDLER_RE.search(value):
         raise ValidationError("Event handlers are not allowed in HTML content")
 
     return value
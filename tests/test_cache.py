@@ -5,8 +5,8 @@ Tests TTL-based caching, expiration, invalidation, and statistics.
 """
 
 import pytest
-import time
 import asyncio
+import threading
 from src.cache import (
     CacheEntry,
     Cache,
@@ -16,6 +16,19 @@ from src.cache import (
 )
 
 
+class FakeClock:
+    """Manually advanced monotonic clock for deterministic TTL tests."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
 class TestCacheEntry:
     """Test CacheEntry class."""
 
@@ -41,15 +54,17 @@ class TestCacheEntry:
 
     def test_entry_expires_after_ttl(self):
         """Test that entry expires after TTL."""
-        entry = CacheEntry("data", ttl_seconds=0.1)  # 100ms
-        time.sleep(0.15)  # Wait 150ms
+        clock = FakeClock()
+        entry = CacheEntry("data", ttl_seconds=0.1, clock=clock)  # 100ms
+        clock.advance(0.15)  # 150ms later
         assert entry.is_expired()
 
     def test_entry_age_increases(self):
         """Test that age increases over time."""
-        entry = CacheEntry("data", ttl_seconds=60)
+        clock = FakeClock()
+        entry = CacheEntry("data", ttl_seconds=60, clock=clock)
         age1 = entry.age_seconds()
-        time.sleep(0.1)
+        clock.advance(0.1)
         age2 = entry.age_seconds()
         assert age2 > age1
 
@@ -113,14 +128,15 @@ class TestCache:
 
     def test_cache_expiration(self):
         """Test that expired entries are not returned."""
-        cache = Cache()
+        clock = FakeClock()
+        cache = Cache(clock=clock)
         cache.set('key1', 'value1', ttl_seconds=0.1)  # 100ms
 
         # Should get value immediately
         assert cache.get('key1') == 'value1'
 
-        # Wait for expiration
-        time.sleep(0.15)
+        # Move past expiration
+        clock.advance(0.15)
 
         # Should return None for expired entry
         result = cache.get('key1')
@@ -158,6 +174,16 @@ class TestCache:
         assert cache.get('user:2') is None
         assert cache.get('project:1') == 'data3'
 
+    def test_cache_invalidate_prefix_after_eviction(self):
+        """Test prefix invalidation only counts keys still in the cache."""
+        cache = Cache(max_size=2)
+        cache.set('user:1', 'data1')
+        cache.set('user:2', 'data2')
+        cache.set('user:3', 'data3')  # evicts user:1
+
+        assert cache.invalidate_prefix('user:') == 2
+        assert cache.get_stats()['size'] == 0
+
     def test_cache_clear(self):
         """Test clearing all entries."""
         cache = Cache()
@@ -174,28 +200,89 @@ class TestCache:
 
     def test_cache_cleanup_expired(self):
         """Test cleanup of expired entries."""
-        cache = Cache()
+        clock = FakeClock()
+        cache = Cache(clock=clock)
         cache.set('key1', 'value1', ttl_seconds=0.1)
         cache.set('key2', 'value2', ttl_seconds=60)
 
-        # Wait for key1 to expire
-        time.sleep(0.15)
+        # Move past key1's expiry
+        clock.advance(0.15)
 
         removed = cache.cleanup_expired()
         assert removed == 1
         assert cache.get('key1') is None
         assert cache.get('key2') == 'value2'
 
+    def test_cache_cleanup_skips_refreshed_entries(self):
+        """Test cleanup does not remove a key re-set with a longer TTL."""
+        clock = FakeClock()
+        cache = Cache(clock=clock)
+        cache.set('key1', 'old', ttl_seconds=0.1)
+        cache.set('key1', 'new', ttl_seconds=60)
+
+        clock.advance(0.15)
+
+        assert cache.cleanup_expired() == 0
+        assert cache.get('key1') == 'new'
+
+    async def test_cache_background_cleanup_removes_due_entries(self):
+        """Test the background task expires entries without a get()."""
+        cache = Cache(cleanup_interval_seconds=0.05)
+        cache.set('key1', 'value1', ttl_seconds=0.05)
+        cache.set('key2', 'value2', ttl_seconds=60)
+
+        await asyncio.sleep(0.2)
+
+        assert 'key1' not in cache._cache
+        assert cache.get_stats()['expirations'] == 1
+        await cache.close()
+
+    def test_cleanup_task_attached_once_per_loop(self):
+        """Test the cleanup task is attached lazily and reused on its loop."""
+        cache = Cache()
+        assert cache._cleanup_task is None
+
+        async def attach_twice():
+            cache._start_cleanup()
+            first = cache._cleanup_task
+            cache._start_cleanup()
+            same = cache._cleanup_task is first
+            await cache.close()
+            return first, same
+
+        first, same = asyncio.run(attach_twice())
+        assert first is not None
+        assert same
+
+    def test_cleanup_task_replaced_after_loop_closes(self):
+        """Test a task stranded on a closed loop is replaced on the next loop."""
+        cache = Cache()
+
+        async def attach():
+            cache._start_cleanup()
+            return cache._cleanup_task
+
+        old_loop = asyncio.new_event_loop()
+        stranded = old_loop.run_until_complete(attach())
+        old_loop.close()
+        assert not stranded.done()
+        # The stranded task can never run again; silence its GC warning
+        stranded._log_destroy_pending = False
+
+        async def attach_and_close():
+            task = await attach()
+            await cache.close()
+            return task
+
+        assert asyncio.run(attach_and_close()) is not stranded
+
     def test_cache_eviction_when_full(self):
         """Test that oldest entry is evicted when cache is full."""
         cache = Cache(max_size=3)
 
         cache.set('key1', 'value1')
-        time.sleep(0.01)
         cache.set('key2', 'value2')
-        time.sleep(0.01)
         cache.set('key3', 'value3')
-        time.sleep(0.01)
 
         # This should evict key1 (oldest)
         cache.set('key4', 'value4')
@@ -205,6 +292,39 @@ class TestCache:
         assert cache.get('key3') == 'value3'
         assert cache.get('key4') == 'value4'
 
+    def test_cache_eviction_is_least_recently_used(self):
+        """Test that a read refreshes an entry's eviction position."""
+        cache = Cache(max_size=3)
+
+        cache.set('key1', 'value1')
+        cache.set('key2', 'value2')
+        cache.set('key3', 'value3')
+
+        # Touch key1 so key2 becomes the least recently used
+        cache.get('key1')
+        cache.set('key4', 'value4')
+
+        assert cache.get('key1') == 'value1'
+        assert cache.get('key2') is None
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_cache_bulk_set(self):
+        """Test bulk insert matches sequential set semantics."""
+        cache = Cache(max_size=3)
+        cache.set('user:0', 'old')
+
+        stored = cache.bulk_set(
+            [('user:1', 'a'), ('user:2', 'b'), ('user:0', 'new'), ('user:3', 'c')],
+            ttl_seconds=60
+        )
+
+        assert stored == 4
+        # user:1 was least recently written and is evicted
+        assert cache.get('user:1') is None
+        assert cache.get('user:0') == 'new'
+        assert cache.get_stats()['evictions'] == 1
+        assert cache.invalidate_prefix('user:') == 3
+
     def test_cache_stats(self):
         """Test cache statistics."""
         cache = Cache()
@@ -247,6 +367,27 @@ class TestGlobalCache:
         cache2 = get_cache()
         assert cache1 is cache2
 
+    def test_get_cache_singleton_across_threads(self):
+        """Test that concurrent first calls all receive one instance."""
+        from src import cache as cache_module
+
+        original = cache_module._global_cache
+        cache_module._global_cache = None
+        try:
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(get_cache()))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len({id(c) for c in results}) == 1
+        finally:
+            cache_module._global_cache = original
+
     def test_get_cache_configuration(self):
         """Test that get_cache uses configuration on first call."""
         # Note: This test may interfere with other tests if they use get_cache()
@@ -298,6 +439,13 @@ class TestMakeCacheKey:
         key = make_cache_key(None, 'value', option=None)
         assert isinstance(key, str)
 
+    def test_make_key_ignores_dict_order(self):
+        """Test that dict arguments are keyed independent of insertion order."""
+        assert make_cache_key('p', {'a': 1, 'b': 2}) == make_cache_key('p', {'b': 2, 'a': 1})
+        assert make_cache_key(opts={'a': [{'x': 1, 'y': 2}]}) == \
+            make_cache_key(opts={'a': [{'y': 2, 'x': 1}]})
+        assert make_cache_key('p', {'a': 1}) != make_cache_key('p', {'a': 2})
+
 
 class TestCachedService:
     """Test CachedService base class."""
@@ -26,64 +26,101 @@ from src.constants import (
 )
 
 
+@pytest.fixture(scope="session")
+def wit_fields():
+    """Resolve field sets once for every work item type used below."""
+    return {
+        wit: get_fields_for_work_item_type(wit)
+        for wit in (
+            'Bug', 'bug', 'BUG', 'User Story', 'Task',
+            'Product Backlog Item', 'UnknownType',
+        )
+    }
+
+
 class TestFieldNames:
     """Test FieldNames class."""
 
-    def test_system_fields_exist(self):
-        """Test that common system fields are defined."""
-        assert hasattr(FieldNames, 'ID')
-        assert hasattr(FieldNames, 'TITLE')
-        assert hasattr(FieldNames, 'STATE')
-        assert hasattr(FieldNames, 'WORK_ITEM_TYPE')
-        assert hasattr(FieldNames, 'ASSIGNED_TO')
-
-    def test_system_field_values(self):
-        """Test that system fields have correct values."""
-        assert FieldNames.ID == "System.Id"
-        assert FieldNames.TITLE == "System.Title"
-        assert FieldNames.STATE == "System.State"
-        assert FieldNames.ASSIGNED_TO == "System.AssignedTo"
-
-    def test_vsts_common_fields_exist(self):
-        """Test that VSTS.Common fields are defined."""
-        assert hasattr(FieldNames, 'PRIORITY')
-        assert hasattr(FieldNames, 'SEVERITY')
-        assert hasattr(FieldNames, 'STACK_RANK')
-        assert hasattr(FieldNames, 'ACTIVITY')
-
-    def test_vsts_common_field_values(self):
-        """Test VSTS.Common field values."""
-        assert FieldNames.PRIORITY == "Microsoft.VSTS.Common.Priority"
-        assert FieldNames.SEVERITY == "Microsoft.VSTS.Common.Severity"
-        assert FieldNames.ACTIVITY == "Microsoft.VSTS.Common.Activity"
-
-    def test_vsts_scheduling_fields_exist(self):
-        """Test that VSTS.Scheduling fields are defined."""
-        assert hasattr(FieldNames, 'REMAINING_WORK')
-        assert hasattr(FieldNames, 'COMPLETED_WORK')
-        assert hasattr(FieldNames, 'STORY_POINTS')
-        assert hasattr(FieldNames, 'ORIGINAL_ESTIMATE')
-
-    def test_vsts_scheduling_field_values(self):
-        """Test VSTS.Scheduling field values."""
-        assert FieldNames.REMAINING_WORK == "Microsoft.VSTS.Scheduling.RemainingWork"
-        assert FieldNames.STORY_POINTS == "Microsoft.VSTS.Scheduling.StoryPoints"
-
-    def test_iteration_and_area_paths(self):
-        """Test path fields."""
-        assert FieldNames.ITERATION_PATH == "System.IterationPath"
-        assert FieldNames.AREA_PATH == "System.AreaPath"
-
-    def test_date_fields_exist(self):
-        """Test that date fields are defined."""
-        assert hasattr(FieldNames, 'CREATED_DATE')
-        assert hasattr(FieldNames, 'CHANGED_DATE')
-        assert hasattr(FieldNames, 'CLOSED_DATE')
-
-    def test_build_fields_exist(self):
-        """Test that build-related fields exist."""
-        assert hasattr(FieldNames, 'INTEGRATION_BUILD')
-        assert hasattr(FieldNames, 'FOUND_IN')
+    @pytest.mark.parametrize("name, expected", [
+        # System fields
+        ('ID', "System.Id"),
+        ('TITLE', "System.Title"),
+        ('STATE', "System.State"),
+        ('WORK_ITEM_TYPE', "System.WorkItemType"),
+        ('ASSIGNED_TO', "System.AssignedTo"),
+        ('ITERATION_PATH', "System.IterationPath"),
+        ('AREA_PATH', "System.AreaPath"),
+        ('CREATED_DATE', "System.CreatedDate"),
+        ('CHANGED_DATE', "System.ChangedDate"),
+        # VSTS.Common fields
+        ('PRIORITY', "Microsoft.VSTS.Common.Priority"),
+        ('SEVERITY', "Microsoft.VSTS.Common.Severity"),
+        ('STACK_RANK', "Microsoft.VSTS.Common.StackRank"),
+        ('ACTIVITY', "Microsoft.VSTS.Common.Activity"),
+        ('CLOSED_DATE', "Microsoft.VSTS.Common.ClosedDate"),
+        # VSTS.Scheduling fields
+        ('REMAINING_WORK', "Microsoft.VSTS.Scheduling.RemainingWork"),
+        ('COMPLETED_WORK', "Microsoft.VSTS.Scheduling.CompletedWork"),
+        ('STORY_POINTS', "Microsoft.VSTS.Scheduling.StoryPoints"),
+        ('ORIGINAL_ESTIMATE', "Microsoft.VSTS.Scheduling.OriginalEstimate"),
+        # Build fields
+        ('INTEGRATION_BUILD', "Microsoft.VSTS.Build.IntegrationBuild"),
+        ('FOUND_IN', "Microsoft.VSTS.Build.FoundIn"),
+    ])
+    def test_field_values(self, name, expected):
+        """Test that fields have correct reference names."""
+        assert getattr(FieldNames, name) == expected
+
+
+FIELD_SETS = {
+    'BASIC_FIELDS': BASIC_FIELDS,
+    'DETAILED_FIELDS': DETAILED_FIELDS,
+    'SPRINT_FIELDS': SPRINT_FIELDS,
+    'BUG_FIELDS': BUG_FIELDS,
+    'USER_STORY_FIELDS': USER_STORY_FIELDS,
+    'TASK_FIELDS': TASK_FIELDS,
+    'MY_WORK_ITEMS_FIELDS': MY_WORK_ITEMS_FIELDS,
+}
+
+# (field set name, field that must be in it)
+FIELD_SET_MEMBERSHIP = [
+    ('BASIC_FIELDS', FieldNames.ID),
+    ('BASIC_FIELDS', FieldNames.TITLE),
+    ('BASIC_FIELDS', FieldNames.STATE),
+    ('BASIC_FIELDS', FieldNames.WORK_ITEM_TYPE),
+    ('BASIC_FIELDS', FieldNames.ASSIGNED_TO),
+    # Metadata
+    ('DETAILED_FIELDS', FieldNames.CREATED_DATE),
+    ('DETAILED_FIELDS', FieldNames.CHANGED_DATE),
+    ('DETAILED_FIELDS', FieldNames.CREATED_BY),
+    # Sprint basics, tracking and effort
+    ('SPRINT_FIELDS', FieldNames.ID),
+    ('SPRINT_FIELDS', FieldNames.TITLE),
+    ('SPRINT_FIELDS', FieldNames.STATE),
+    ('SPRINT_FIELDS', FieldNames.ITERATION_PATH),
+    ('SPRINT_FIELDS', FieldNames.PRIORITY),
+    ('SPRINT_FIELDS', FieldNames.REMAINING_WORK),
+    ('SPRINT_FIELDS', FieldNames.STORY_POINTS),
+    # Bug-specific
+    ('BUG_FIELDS', FieldNames.SEVERITY),
+    ('BUG_FIELDS', FieldNames.PRIORITY),
+    ('BUG_FIELDS', FieldNames.REPRO_STEPS),
+    # Story-specific
+    ('USER_STORY_FIELDS', FieldNames.STORY_POINTS),
+    ('USER_STORY_FIELDS', FieldNames.PRIORITY),
+    ('USER_STORY_FIELDS', FieldNames.ACCEPTANCE_CRITERIA),
+    # Task-specific
+    ('TASK_FIELDS', FieldNames.REMAINING_WORK),
+    ('TASK_FIELDS', FieldNames.COMPLETED_WORK),
+    ('TASK_FIELDS', FieldNames.ORIGINAL_ESTIMATE),
+    ('TASK_FIELDS', FieldNames.ACTIVITY),
+    # My work items essentials
+    ('MY_WORK_ITEMS_FIELDS', FieldNames.ID),
+    ('MY_WORK_ITEMS_FIELDS', FieldNames.TITLE),
+    ('MY_WORK_ITEMS_FIELDS', FieldNames.STATE),
+    ('MY_WORK_ITEMS_FIELDS', FieldNames.ASSIGNED_TO),
+    ('MY_WORK_ITEMS_FIELDS', FieldNames.ITERATION_PATH),
+]
 
 
 class TestFieldSets:
@@ -92,11 +129,6 @@ class TestFieldSets:
     def test_basic_fields_minimal(self):
         """Test that BASIC_FIELDS is minimal."""
         assert len(BASIC_FIELDS) == 5
-        assert FieldNames.ID in BASIC_FIELDS
-        assert FieldNames.TITLE in BASIC_FIELDS
-        assert FieldNames.STATE in BASIC_FIELDS
-        assert FieldNames.WORK_ITEM_TYPE in BASIC_FIELDS
-        assert FieldNames.ASSIGNED_TO in BASIC_FIELDS
 
     def test_detailed_fields_includes_basic(self):
         """Test that DETAILED_FIELDS includes all BASIC_FIELDS."""
@@ -107,51 +139,16 @@ class TestFieldSets:
         """Test that DETAILED_FIELDS has more fields than BASIC_FIELDS."""
         assert len(DETAILED_FIELDS) > len(BASIC_FIELDS)
 
-    def test_detailed_fields_includes_metadata(self):
-        """Test that DETAILED_FIELDS includes metadata."""
-        assert FieldNames.CREATED_DATE in DETAILED_FIELDS
-        assert FieldNames.CHANGED_DATE in DETAILED_FIELDS
-        assert FieldNames.CREATED_BY in DETAILED_FIELDS
-
-    def test_sprint_fields_includes_tracking(self):
-        """Test that SPRINT_FIELDS includes sprint tracking fields."""
-        assert FieldNames.ITERATION_PATH in SPRINT_FIELDS
-        assert FieldNames.PRIORITY in SPRINT_FIELDS
-        assert FieldNames.REMAINING_WORK in SPRINT_FIELDS
-        assert FieldNames.STORY_POINTS in SPRINT_FIELDS
-
-    def test_bug_fields_includes_bug_specific(self):
-        """Test that BUG_FIELDS includes bug-specific fields."""
-        assert FieldNames.SEVERITY in BUG_FIELDS
-        assert FieldNames.PRIORITY in BUG_FIELDS
-        assert FieldNames.REPRO_STEPS in BUG_FIELDS
-
-    def test_user_story_fields_includes_story_specific(self):
-        """Test that USER_STORY_FIELDS includes story-specific fields."""
-        assert FieldNames.STORY_POINTS in USER_STORY_FIELDS
-        assert FieldNames.PRIORITY in USER_STORY_FIELDS
-        assert FieldNames.ACCEPTANCE_CRITERIA in USER_STORY_FIELDS
-
-    def test_task_fields_includes_task_specific(self):
-        """Test that TASK_FIELDS includes task-specific fields."""
-        assert FieldNames.REMAINING_WORK in TASK_FIELDS
-        assert FieldNames.COMPLETED_WORK in TASK_FIELDS
-        assert FieldNames.ORIGINAL_ESTIMATE in TASK_FIELDS
-        assert FieldNames.ACTIVITY in TASK_FIELDS
-
-    def test_my_work_items_fields_includes_essentials(self):
-        """Test that MY_WORK_ITEMS_FIELDS includes essential fields."""
-        assert FieldNames.ID in MY_WORK_ITEMS_FIELDS
-        assert FieldNames.TITLE in MY_WORK_ITEMS_FIELDS
-        assert FieldNames.STATE in MY_WORK_ITEMS_FIELDS
-        assert FieldNames.ASSIGNED_TO in MY_WORK_ITEMS_FIELDS
-        assert FieldNames.ITERATION_PATH in MY_WORK_ITEMS_FIELDS
-
-    def test_no_duplicate_fields(self):
+    @pytest.mark.parametrize("set_name, member", FIELD_SET_MEMBERSHIP)
+    def test_field_set_membership(self, set_name, member):
+        """Test that each field set includes its required fields."""
+        assert member in FIELD_SETS[set_name]
+
+    @pytest.mark.parametrize("set_name", list(FIELD_SETS))
+    def test_no_duplicate_fields(self, set_name):
         """Test that field sets don't have duplicates."""
-        assert len(BASIC_FIELDS) == len(set(BASIC_FIELDS))
-        assert len(DETAILED_FIELDS) == len(set(DETAILED_FIELDS))
-        assert len(SPRINT_FIELDS) == len(set(SPRINT_FIELDS))
+        field_set = FIELD_SETS[set_name]
+        assert len(field_set) == len(set(field_set))
 
 
 class TestQueryLimits:
@@ -211,18 +208,16 @@ class TestExpandOptions:
 class TestWorkItemStates:
     """Test WorkItemStates class."""
 
-    def test_basic_states_exist(self):
-        """Test that basic states are defined."""
-        assert hasattr(WorkItemStates, 'NEW')
-        assert hasattr(WorkItemStates, 'ACTIVE')
-        assert hasattr(WorkItemStates, 'RESOLVED')
-        assert hasattr(WorkItemStates, 'CLOSED')
-
-    def test_state_values(self):
+    @pytest.mark.parametrize("name, expected", [
+        ('NEW', "New"),
+        ('ACTIVE', "Active"),
+        ('RESOLVED', "Resolved"),
+        ('CLOSED', "Closed"),
+        ('DONE', "Done"),
+    ])
+    def test_state_values(self, name, expected):
         """Test state values."""
-        assert WorkItemStates.NEW == "New"
-        assert WorkItemStates.ACTIVE == "Active"
-        assert WorkItemStates.DONE == "Done"
+        assert getattr(WorkItemStates, name) == expected
 
     def test_completed_states_set(self):
         """Test COMPLETED_STATES set."""
@@ -239,145 +234,96 @@ class TestWorkItemStates:
 
     def test_states_dont_overlap(self):
         """Test that completed and in-progress states don't overlap."""
-        overlap = WorkItemStates.COMPLETED_STATES & WorkItemStates.IN_PROGRESS_STATES
-        assert len(overlap) == 0
+        assert not WorkItemStates.COMPLETED_STATES & WorkItemStates.IN_PROGRESS_STATES
 
-    def test_states_are_non_empty(self):
+    @pytest.mark.parametrize("name, states", [
+        ('completed', WorkItemStates.COMPLETED_STATES),
+        ('in_progress', WorkItemStates.IN_PROGRESS_STATES),
+    ])
+    def test_states_are_non_empty(self, name, states):
         """Test that state sets are non-empty."""
-        assert len(WorkItemStates.COMPLETED_STATES) > 0
-        assert len(WorkItemStates.IN_PROGRESS_STATES) > 0
+        assert states
 
 
 class TestLinkTypes:
     """Test LinkTypes class."""
 
-    def test_hierarchy_links_exist(self):
-        """Test that hierarchy link types exist."""
-        assert hasattr(LinkTypes, 'HIERARCHY_FORWARD')
-        assert hasattr(LinkTypes, 'HIERARCHY_REVERSE')
-        assert hasattr(LinkTypes, 'PARENT')
-        assert hasattr(LinkTypes, 'CHILD')
-
-    def test_dependency_links_exist(self):
-        """Test that dependency link types exist."""
-        assert hasattr(LinkTypes, 'DEPENDENCY_FORWARD')
-        assert hasattr(LinkTypes, 'DEPENDENCY_REVERSE')
-        assert hasattr(LinkTypes, 'SUCCESSOR')
-        assert hasattr(LinkTypes, 'PREDECESSOR')
-
-    def test_link_type_values(self):
+    @pytest.mark.parametrize("name, expected", [
+        # Hierarchy links
+        ('HIERARCHY_FORWARD', "System.LinkTypes.Hierarchy-Forward"),
+        ('HIERARCHY_REVERSE', "System.LinkTypes.Hierarchy-Reverse"),
+        ('PARENT', "System.LinkTypes.Parent"),
+        ('CHILD', "System.LinkTypes.Child"),
+        # Dependency links
+        ('DEPENDENCY_FORWARD', "System.LinkTypes.Dependency-Forward"),
+        ('DEPENDENCY_REVERSE', "System.LinkTypes.Dependency-Reverse"),
+        ('SUCCESSOR', "System.LinkTypes.Successor"),
+        ('PREDECESSOR', "System.LinkTypes.Predecessor"),
+        ('RELATED', "System.LinkTypes.Related"),
+    ])
+    def test_link_type_values(self, name, expected):
         """Test link type values."""
-        assert LinkTypes.RELATED == "System.LinkTypes.Related"
-        assert "System.LinkTypes" in LinkTypes.HIERARCHY_FORWARD
+        assert getattr(LinkTypes, name) == expected
 
 
+@pytest.mark.parametrize("cls", [Priority, Severity])
 class TestPriorityAndSeverity:
     """Test Priority and Severity classes."""
 
-    def test_priority_values(self):
-        """Test priority values."""
-        assert Priority.CRITICAL == 1
-        assert Priority.HIGH == 2
-        assert Priority.MEDIUM == 3
-        assert Priority.LOW == 4
-
-    def test_priority_ordering(self):
-        """Test that priority values are ordered (1 is highest)."""
-        assert Priority.CRITICAL < Priority.HIGH
-        assert Priority.HIGH < Priority.MEDIUM
-        assert Priority.MEDIUM < Priority.LOW
-
-    def test_severity_values(self):
-        """Test severity values."""
-        assert Severity.CRITICAL == 1
-        assert Severity.HIGH == 2
-        assert Severity.MEDIUM == 3
-        assert Severity.LOW == 4
-
-    def test_severity_ordering(self):
-        """Test that severity values are ordered (1 is most severe)."""
-        assert Severity.CRITICAL < Severity.HIGH
-        assert Severity.HIGH < Severity.MEDIUM
-        assert Severity.MEDIUM < Severity.LOW
+    @pytest.mark.parametrize("name, value", [
+        ('CRITICAL', 1),
+        ('HIGH', 2),
+        ('MEDIUM', 3),
+        ('LOW', 4),
+    ])
+    def test_values(self, cls, name, value):
+        """Test priority/severity values."""
+        assert getattr(cls, name) == value
+
+    def test_ordering(self, cls):
+        """Test that values are ordered (1 is highest/most severe)."""
+        assert cls.CRITICAL < cls.HIGH < cls.MEDIUM < cls.LOW
 
 
 class TestHelperFunctions:
     """Test helper functions."""
 
-    def test_get_fields_for_bug(self):
-        """Test getting fields for Bug work item type."""
-        fields = get_fields_for_work_item_type('Bug')
-        assert fields == BUG_FIELDS
-        assert FieldNames.SEVERITY in fields
-
-    def test_get_fields_for_user_story(self):
-        """Test getting fields for User Story work item type."""
-        fields = get_fields_for_work_item_type('User Story')
-        assert fields == USER_STORY_FIELDS
-        assert FieldNames.STORY_POINTS in fields
-
-    def test_get_fields_for_task(self):
-        """Test getting fields for Task work item type."""
-        fields = get_fields_for_work_item_type('Task')
-        assert fields == TASK_FIELDS
-        assert FieldNames.REMAINING_WORK in fields
-
-    def test_get_fields_case_insensitive(self):
-        """Test that field lookup is case-insensitive."""
-        fields1 = get_fields_for_work_item_type('BUG')
-        fields2 = get_fields_for_work_item_type('bug')
-        fields3 = get_fields_for_work_item_type('Bug')
-        assert fields1 == fields2 == fields3
-
-    def test_get_fields_for_unknown_type(self):
-        """Test that unknown types return DETAILED_FIELDS."""
-        fields = get_fields_for_work_item_type('UnknownType')
-        assert fields == DETAILED_FIELDS
-
-    def test_get_fields_for_product_backlog_item(self):
-        """Test getting fields for Product Backlog Item (Scrum)."""
-        fields = get_fields_for_work_item_type('Product Backlog Item')
-        assert fields == USER_STORY_FIELDS
-
-    def test_fields_to_string_basic(self):
+    @pytest.mark.parametrize("wit, expected", [
+        ('Bug', BUG_FIELDS),
+        ('BUG', BUG_FIELDS),
+        ('bug', BUG_FIELDS),
+        ('User Story', USER_STORY_FIELDS),
+        # Scrum equivalent of User Story
+        ('Product Backlog Item', USER_STORY_FIELDS),
+        ('Task', TASK_FIELDS),
+        # Unknown types fall back to DETAILED_FIELDS
+        ('UnknownType', DETAILED_FIELDS),
+    ])
+    def test_get_fields_for_work_item_type(self, wit_fields, wit, expected):
+        """Test field set lookup by work item type (case-insensitive)."""
+        assert wit_fields[wit] == expected
+
+    @pytest.mark.parametrize("fields, expected", [
+        ([FieldNames.ID, FieldNames.TITLE, FieldNames.STATE],
+         "System.Id,System.Title,System.State"),
+        ([], ""),
+        ([FieldNames.ID], "System.Id"),
+    ])
+    def test_fields_to_string(self, fields, expected):
         """Test converting field list to string."""
-        fields = [FieldNames.ID, FieldNames.TITLE, FieldNames.STATE]
-        result = fields_to_string(fields)
-        assert result == "System.Id,System.Title,System.State"
-
-    def test_fields_to_string_empty(self):
-        """Test converting empty field list."""
-        result = fields_to_string([])
-        assert result == ""
-
-    def test_fields_to_string_single(self):
-        """Test converting single field."""
-        result = fields_to_string([FieldNames.ID])
-        assert result == "System.Id"
-
-    def test_format_wiql_fields_basic(self):
+        assert fields_to_string(fields) == expected
+
+    @pytest.mark.parametrize("fields, expected", [
+        ([FieldNames.ID, FieldNames.TITLE], "[System.Id], [System.Title]"),
+        ([], ""),
+        ([FieldNames.STATE], "[System.State]"),
+        # Each field is wrapped in brackets
+        ([FieldNames.ID, FieldNames.TITLE, FieldNames.STATE],
+         "[System.Id], [System.Title], [System.State]"),
+    ])
+    def test_format_wiql_fields(self, fields, expected):
         """Test formatting fields for WIQL."""
-        fields = [FieldNames.ID, FieldNames.TITLE]
-        result = format_wiql_fields(fields)
-        assert result == "[System.Id], [System.Title]"
-
-    def test_format_wiql_fields_empty(self):
-        """Test formatting empty field list for WIQL."""
-        result = format_wiql_fields([])
-        assert result == ""
-
-    def test_format_wiql_fields_single(self):
-        """Test formatting single field for WIQL."""
-        result = format_wiql_fields([FieldNames.STATE])
-        assert result == "[System.State]"
-
-    def test_format_wiql_fields_brackets(self):
-        """Test that WIQL formatting adds brackets."""
-        fields = [FieldNames.ID, FieldNames.TITLE, FieldNames.STATE]
-        result = format_wiql_fields(fields)
-        # Each field should be in brackets
-        assert result.count('[') == 3
-        assert result.count(']') == 3
+        assert format_wiql_fields(fields) == expected
 
 
 class TestConstantsIntegration:
@@ -390,21 +336,6 @@ class TestConstantsIntegration:
             assert isinstance(field, str)
             assert field.startswith('System.') or field.startswith('Microsoft.VSTS.')
 
-    def test_sprint_fields_optimized_for_sprints(self):
-        """Test that SPRINT_FIELDS is optimized for sprint queries."""
-        # Should include ID, title, state (basics)
-        assert FieldNames.ID in SPRINT_FIELDS
-        assert FieldNames.TITLE in SPRINT_FIELDS
-        assert FieldNames.STATE in SPRINT_FIELDS
-
-        # Should include sprint tracking
-        assert FieldNames.ITERATION_PATH in SPRINT_FIELDS
-        assert FieldNames.PRIORITY in SPRINT_FIELDS
-
-        # Should include effort tracking
-        assert FieldNames.REMAINING_WORK in SPRINT_FIELDS
-        assert FieldNames.STORY_POINTS in SPRINT_FIELDS
-
     def test_limits_suitable_for_azure_devops(self):
         """Test that limits are suitable for Azure DevOps API."""
         # Azure DevOps max is 20,000
@@ -415,22 +346,3 @@ class TestConstantsIntegration:
 
         # Batch size should be efficient
         assert 100 <= QueryLimits.BATCH_SIZE <= 500
-
-    def test_work_item_type_field_sets_comprehensive(self):
-        """Test that work item type field sets are comprehensive."""
-        # Bug fields should cover bug-specific needs
-        bug_fields = get_fields_for_work_item_type('Bug')
-        assert FieldNames.SEVERITY in bug_fields
-        assert FieldNames.PRIORITY in bug_fields
-        assert FieldNames.REPRO_STEPS in bug_fields
-
-        # User Story fields should cover story-specific needs
-        story_fields = get_fields_for_work_item_type('User Story')
-        assert FieldNames.STORY_POINTS in story_fields
-        assert FieldNames.ACCEPTANCE_CRITERIA in story_fields
-
-        # Task fields should cover task-specific needs
-        task_fields = get_fields_for_work_item_type('Task')
-        assert FieldNames.REMAINING_WORK in task_fields
-        assert FieldNames.COMPLETED_WORK in task_fields
-        assert FieldNames.ACTIVITY in task_fields
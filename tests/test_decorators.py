@@ -19,77 +19,74 @@ from src.errors import (
     WorkItemNotFoundError
 )
 
+# Share one event loop across this module's async tests
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class TestRetryDecorator:
     """Test retry_on_transient_error decorator."""
 
-    @pytest.mark.asyncio
+    @staticmethod
+    def _mock_operation(*side_effect):
+        """Async mock that yields each side effect in turn."""
+        operation = AsyncMock(side_effect=list(side_effect))
+        # The decorators log func.__name__, which mocks don't provide
+        operation.__name__ = 'operation'
+        return operation
+
     async def test_retry_successful_first_attempt(self):
         """Test that successful calls don't retry."""
-        call_count = 0
+        operation = self._mock_operation("success")
 
-        @retry_on_transient_error(max_retries=3)
-        async def successful_function():
-            nonlocal call_count
-            call_count += 1
-            return "success"
-
-        result = await successful_function()
+        result = await retry_on_transient_error(max_retries=3)(operation)()
         assert result == "success"
-        assert call_count == 1
+        assert operation.await_count == 1
 
-    @pytest.mark.asyncio
     async def test_retry_on_transient_error_succeeds(self):
         """Test that transient errors are retried and eventually succeed."""
-        call_count = 0
+        operation = self._mock_operation(
+            TransientError(status_code=503),
+            TransientError(status_code=503),
+            "success"
+        )
 
-        @retry_on_transient_error(max_retries=3, base_delay=0.01)
-        async def flaky_function():
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise TransientError(status_code=503)
-            return "success"
-
-        result = await flaky_function()
+        result = await retry_on_transient_error(max_retries=3, base_delay=0.01)(operation)()
         assert result == "success"
-        assert call_count == 3
+        assert operation.await_count == 3
 
-    @pytest.mark.asyncio
     async def test_retry_exhausted(self):
         """Test that retries are exhausted and error is raised."""
-        call_count = 0
-
-        @retry_on_transient_error(max_retries=2, base_delay=0.01)
-        async def always_fails():
-            nonlocal call_count
-            call_count += 1
-            raise TransientError(status_code=503)
+        operation = self._mock_operation(
+            *(TransientError(status_code=503) for _ in range(3))
+        )
 
         with pytest.raises(TransientError):
-            await always_fails()
+            await retry_on_transient_error(max_retries=2, base_delay=0.01)(operation)()
 
         # Should be called 3 times: initial + 2 retries
-        assert call_count == 3
+        assert operation.await_count == 3
 
-    @pytest.mark.asyncio
     async def test_retry_non_transient_error_not_retried(self):
         """Test that non-transient errors are not retried."""
-        call_count = 0
-
-        @retry_on_transient_error(max_retries=3)
-        async def non_transient_error():
-            nonlocal call_count
-            call_count += 1
-            raise WorkItemNotFoundError(work_item_id=123)
+        operation = self._mock_operation(WorkItemNotFoundError(work_item_id=123))
 
         with pytest.raises(WorkItemNotFoundError):
-            await non_transient_error()
+            await retry_on_transient_error(max_retries=3)(operation)()
 
         # Should only be called once (no retries for non-transient errors)
-        assert call_count == 1
+        assert operation.await_count == 1
+
+    async def test_retry_disabled_returns_function_unwrapped(self):
+        """Test that max_retries=0 leaves the function as-is."""
+        operation = self._mock_operation(TransientError(status_code=503))
+
+        decorated = retry_on_transient_error(max_retries=0)(operation)
+        assert decorated is operation
+
+        with pytest.raises(TransientError):
+            await decorated()
+        assert operation.await_count == 1
 
-    @pytest.mark.asyncio
     async def test_retry_rate_limit_with_retry_after(self):
         """Test that rate limits with retry-after are handled."""
         call_count = 0
@@ -102,41 +99,75 @@ class TestRetryDecorator:
                 raise RateLimitError(retry_after=0.05)  # 50ms
             return "success"
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = await rate_limited()
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
 
         assert result == "success"
         assert call_count == 2
         # Should have waited at least 50ms for retry_after
         assert elapsed >= 0.05
 
-    @pytest.mark.asyncio
     async def test_retry_exponential_backoff(self):
         """Test exponential backoff between retries."""
-        call_times = []
+        call_count = 0
 
         @retry_on_transient_error(max_retries=3, base_delay=0.05, exponential_base=2.0)
         async def track_timing():
-            call_times.append(time.time())
-            if len(call_times) < 3:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
                 raise TransientError(status_code=503)
             return "success"
 
-        await track_timing()
+        with patch('src.decorators.asyncio.sleep', new_callable=AsyncMock) as sleep:
+            await track_timing()
+
+        # First delay: 50ms, second delay: 100ms (exponential)
+        delays = [c.args[0] for c in sleep.await_args_list]
+        assert delays == [pytest.approx(0.05), pytest.approx(0.1)]
+
+    async def test_retry_backoff_does_not_block_event_loop(self):
+        """Test that concurrent retries back off in parallel."""
+        call_counts = {}
+
+        @retry_on_transient_error(max_retries=1, base_delay=0.1)
+        async def flaky(key):
+            call_counts[key] = call_counts.get(key, 0) + 1
+            if call_counts[key] == 1:
+                raise TransientError(status_code=503)
+            return key
 
-        # Calculate delays between calls
-        delays = [call_times[i+1] - call_times[i] for i in range(len(call_times) - 1)]
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*(flaky(i) for i in range(5)))
+        elapsed = time.perf_counter() - start_time
 
-        # First delay: ~50ms, second delay: ~100ms (exponential)
-        assert delays[0] >= 0.045  # Allow some margin
-        assert delays[1] >= 0.090  # Should be roughly 2x first delay
+        assert results == list(range(5))
+        # Five 100ms backoffs overlap instead of adding up to 500ms
+        assert elapsed < 0.3
+
+    async def test_retry_jitter_bounds_delay(self):
+        """Test that jitter only lengthens the delay, by at most the fraction."""
+        call_count = 0
+
+        @retry_on_transient_error(max_retries=1, base_delay=0.05, jitter=0.5)
+        async def track_timing():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise TransientError(status_code=503)
+            return "success"
+
+        with patch('src.decorators.asyncio.sleep', new_callable=AsyncMock) as sleep:
+            await track_timing()
+
+        delay = sleep.await_args.args[0]
+        assert 0.05 <= delay <= 0.075
 
 
 class TestTimeoutDecorator:
     """Test with_timeout decorator."""
 
-    @pytest.mark.asyncio
     async def test_timeout_successful_completion(self):
         """Test that fast functions complete successfully."""
         @with_timeout(timeout_seconds=1.0)
@@ -147,7 +178,6 @@ class TestTimeoutDecorator:
         result = await fast_function()
         assert result == "success"
 
-    @pytest.mark.asyncio
     async def test_timeout_raises_error(self):
         """Test that slow functions timeout."""
         @with_timeout(timeout_seconds=0.1)
@@ -158,7 +188,6 @@ class TestTimeoutDecorator:
         with pytest.raises(asyncio.TimeoutError):
             await slow_function()
 
-    @pytest.mark.asyncio
     async def test_timeout_with_arguments(self):
         """Test that timeout works with function arguments."""
         @with_timeout(timeout_seconds=1.0)
@@ -173,7 +202,6 @@ class TestTimeoutDecorator:
 class TestAzureDevOpsOperationDecorator:
     """Test azure_devops_operation unified decorator."""
 
-    @pytest.mark.asyncio
     async def test_operation_successful(self):
         """Test successful operation."""
         @azure_devops_operation()
@@ -183,7 +211,6 @@ class TestAzureDevOpsOperationDecorator:
         result = await successful_op()
         assert result == "success"
 
-    @pytest.mark.asyncio
     async def test_operation_with_timeout(self):
         """Test operation timeout."""
         @azure_devops_operation(timeout_seconds=0.1)
@@ -194,7 +221,6 @@ class TestAzureDevOpsOperationDecorator:
         with pytest.raises(asyncio.TimeoutError):
             await slow_op()
 
-    @pytest.mark.asyncio
     async def test_operation_with_retry(self):
         """Test operation retry on transient errors."""
         call_count = 0
@@ -211,23 +237,6 @@ class TestAzureDevOpsOperationDecorator:
         assert result == "success"
         assert call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_operation_non_transient_error_not_retried(self):
-        """Test that non-transient errors are not retried."""
-        call_count = 0
-
-        @azure_devops_operation(max_retries=3)
-        async def non_transient_op():
-            nonlocal call_count
-            call_count += 1
-            raise WorkItemNotFoundError(work_item_id=123)
-
-        with pytest.raises(WorkItemNotFoundError):
-            await non_transient_op()
-
-        assert call_count == 1
-
-    @pytest.mark.asyncio
     async def test_operation_with_arguments(self):
         """Test operation with function arguments."""
         @azure_devops_operation()
@@ -237,7 +246,6 @@ class TestAzureDevOpsOperationDecorator:
         result = await op_with_args(1, 2, c=3)
         assert result == "1+2+3"
 
-    @pytest.mark.asyncio
     async def test_operation_preserves_function_name(self):
         """Test that decorator preserves function name."""
         @azure_devops_operation()
@@ -250,7 +258,6 @@ class TestAzureDevOpsOperationDecorator:
 class TestDecoratorCombinations:
     """Test combinations of decorators."""
 
-    @pytest.mark.asyncio
     async def test_retry_with_timeout(self):
         """Test retry and timeout working together."""
         call_count = 0
@@ -269,7 +276,6 @@ class TestDecoratorCombinations:
         assert result == "success"
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_multiple_retries_within_timeout(self):
         """Test that retries complete within timeout."""
         call_count = 0
@@ -286,7 +292,6 @@ class TestDecoratorCombinations:
         result = await many_retries()
         assert result == "success"
 
-    @pytest.mark.asyncio
     async def test_timeout_during_retry(self):
         """Test that timeout can occur during retries."""
         @with_timeout(timeout_seconds=0.1)
@@ -302,7 +307,6 @@ class TestDecoratorCombinations:
 class TestDecoratorErrorHandling:
     """Test error handling in decorators."""
 
-    @pytest.mark.asyncio
     async def test_decorator_preserves_error_details(self):
         """Test that decorators preserve error details."""
         @azure_devops_operation()
@@ -316,7 +320,6 @@ class TestDecoratorErrorHandling:
         assert "456" in str(error)
         assert error.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_decorator_with_rate_limit(self):
         """Test decorator handling rate limit errors."""
         call_count = 0
@@ -333,110 +336,122 @@ class TestDecoratorErrorHandling:
         assert result == "success"
         assert call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_decorator_with_generic_exception(self):
-        """Test that decorators don't catch non-Azure DevOps errors."""
-        @azure_devops_operation()
-        async def generic_error():
-            raise ValueError("Generic error")
+    @pytest.mark.parametrize("error", [
+        WorkItemNotFoundError(work_item_id=123),
+        # Non-Azure DevOps errors should pass through as-is
+        ValueError("Generic error"),
+    ], ids=["non_transient", "generic"])
+    async def test_non_retryable_error_not_retried(self, error):
+        """Test that non-transient and generic errors are not retried."""
+        call_count = 0
 
-        # Generic errors should pass through without retry
-        with pytest.raises(ValueError):
-            await generic_error()
+        @azure_devops_operation(max_retries=3)
+        async def failing_op():
+            nonlocal call_count
+            call_count += 1
+            raise error
+
+        with pytest.raises(type(error)):
+            await failing_op()
+
+        assert call_count == 1
 
 
 class TestDecoratorPerformance:
     """Test decorator performance characteristics."""
 
-    @pytest.mark.asyncio
     async def test_retry_delay_increases_exponentially(self):
         """Test that retry delays increase exponentially."""
-        call_times = []
+        call_count = 0
 
         @retry_on_transient_error(max_retries=4, base_delay=0.02, exponential_base=2.0)
         async def measure_delays():
-            call_times.append(time.time())
-            if len(call_times) < 4:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 4:
                 raise TransientError(status_code=503)
             return "success"
 
-        await measure_delays()
+        # Record requested delays instead of sleeping through them
+        with patch('src.decorators.asyncio.sleep', new_callable=AsyncMock) as sleep:
+            await measure_delays()
 
-        # Calculate delays
-        delays = [call_times[i+1] - call_times[i] for i in range(len(call_times) - 1)]
+        # Delays should be: 20ms, 40ms, 80ms
+        delays = [c.args[0] for c in sleep.await_args_list]
+        assert delays == [
+            pytest.approx(0.02),
+            pytest.approx(0.04),
+            pytest.approx(0.08),
+        ]
 
-        # Delays should be approximately: 20ms, 40ms, 80ms
-        # Allow 50% margin for timing variability
-        assert 0.015 <= delays[0] <= 0.030  # ~20ms
-        assert 0.030 <= delays[1] <= 0.060  # ~40ms
-        assert 0.060 <= delays[2] <= 0.120  # ~80ms
-
-    @pytest.mark.asyncio
     async def test_no_delay_on_success(self):
         """Test that successful calls have no artificial delay."""
         @retry_on_transient_error(max_retries=3, base_delay=1.0)
         async def instant_success():
             return "success"
 
-        start = time.time()
+        start = time.perf_counter()
         await instant_success()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         # Should complete instantly (< 100ms)
         assert elapsed < 0.1
 
-    @pytest.mark.asyncio
     async def test_timeout_precision(self):
         """Test that timeout is relatively precise."""
         @with_timeout(timeout_seconds=0.2)
         async def precise_timeout():
             await asyncio.sleep(1.0)
 
-        start = time.time()
+        start = time.perf_counter()
         with pytest.raises(asyncio.TimeoutError):
             await precise_timeout()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         # Should timeout close to specified time (within 50ms)
         assert 0.18 <= elapsed <= 0.25
 
 
+class DataService:
+    """Service whose method is wrapped by azure_devops_operation."""
+
+    def __init__(self):
+        self.call_count = 0
+
+    @azure_devops_operation()
+    async def get_data(self, work_item_id):
+        self.call_count += 1
+        return f"data_{work_item_id}"
+
+
+class FlakyService:
+    """Service whose method fails once with a transient error."""
+
+    def __init__(self):
+        self.attempt = 0
+
+    @azure_devops_operation(max_retries=3)
+    async def flaky_method(self):
+        self.attempt += 1
+        if self.attempt < 2:
+            raise TransientError(status_code=503)
+        return "success"
+
+
 class TestDecoratorUsagePatterns:
     """Test common usage patterns."""
 
-    @pytest.mark.asyncio
     async def test_decorator_on_class_method(self):
         """Test decorator on class methods."""
-        class Service:
-            def __init__(self):
-                self.call_count = 0
-
-            @azure_devops_operation()
-            async def get_data(self, work_item_id):
-                self.call_count += 1
-                return f"data_{work_item_id}"
-
-        service = Service()
+        service = DataService()
         result = await service.get_data(123)
 
         assert result == "data_123"
         assert service.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_decorator_with_retries_on_method(self):
         """Test decorator with retries on class method."""
-        class Service:
-            def __init__(self):
-                self.attempt = 0
-
-            @azure_devops_operation(max_retries=3)
-            async def flaky_method(self):
-                self.attempt += 1
-                if self.attempt < 2:
-                    raise TransientError(status_code=503)
-                return "success"
-
-        service = Service()
+        service = FlakyService()
         result = await service.flaky_method()
 
         assert result == "success"
@@ -135,29 +135,17 @@ class TestRateLimitError:
 class TestTransientError:
     """Test TransientError (500-504)."""
 
-    def test_error_with_status_500(self):
-        """Test transient error with 500 status."""
-        error = TransientError(status_code=500)
-        assert error.status_code == 500
-        assert "temporarily unavailable" in str(error).lower()
-
-    def test_error_with_status_502(self):
-        """Test transient error with 502 status."""
-        error = TransientError(status_code=502)
-        assert error.status_code == 502
-        assert "502" in str(error)
-
-    def test_error_with_status_503(self):
-        """Test transient error with 503 status."""
-        error = TransientError(status_code=503)
-        assert error.status_code == 503
-        assert "503" in str(error)
-
-    def test_error_with_status_504(self):
-        """Test transient error with 504 status."""
-        error = TransientError(status_code=504)
-        assert error.status_code == 504
-        assert "timeout" in str(error).lower()
+    @pytest.mark.parametrize("code, substr", [
+        (500, "temporarily unavailable"),
+        (502, "502"),
+        (503, "503"),
+        (504, "timeout"),
+    ])
+    def test_error_with_status(self, code, substr):
+        """Test transient error with 5xx status."""
+        error = TransientError(status_code=code)
+        assert error.status_code == code
+        assert substr in str(error).lower()
 
     def test_error_suggestions(self):
         """Test that error suggests automatic retry."""
@@ -262,11 +250,6 @@ class TestErrorUsage:
         with pytest.raises(AzureDevOpsError):
             raise WorkItemNotFoundError(work_item_id=123)
 
-    def test_error_can_be_caught_as_exception(self):
-        """Test that errors can be caught as generic Exception."""
-        with pytest.raises(Exception):
-            raise RateLimitError(retry_after=60)
-
     def test_multiple_error_types(self):
         """Test catching multiple error types."""
         errors = [
@@ -281,21 +264,25 @@ class TestErrorUsage:
                 raise error
 
 
+@pytest.fixture(scope="module")
+def sample_errors():
+    """One instance of each HTTP-mapped error, built once per module."""
+    return {
+        WorkItemNotFoundError: WorkItemNotFoundError(),
+        AuthenticationError: AuthenticationError(),
+        PermissionDeniedError: PermissionDeniedError(),
+        RateLimitError: RateLimitError(retry_after=60),
+        TransientError: TransientError(status_code=500),
+        QueryTooLargeError: QueryTooLargeError(result_count=1000, max_results=500),
+    }
+
+
 class TestErrorAttributes:
     """Test that errors have expected attributes."""
 
-    def test_all_errors_have_status_code(self):
+    def test_all_errors_have_status_code(self, sample_errors):
         """Test that all errors have status_code attribute."""
-        errors = [
-            WorkItemNotFoundError(),
-            AuthenticationError(),
-            PermissionDeniedError(),
-            RateLimitError(),
-            TransientError(status_code=500),
-            QueryTooLargeError()
-        ]
-
-        for error in errors:
+        for error in sample_errors.values():
             assert hasattr(error, 'status_code')
             assert error.status_code is not None
 
@@ -310,15 +297,15 @@ class TestErrorAttributes:
         for error in errors:
             assert hasattr(error, 'field_name')
 
-    def test_rate_limit_has_retry_after(self):
+    def test_rate_limit_has_retry_after(self, sample_errors):
         """Test that RateLimitError has retry_after attribute."""
-        error = RateLimitError(retry_after=60)
+        error = sample_errors[RateLimitError]
         assert hasattr(error, 'retry_after')
         assert error.retry_after == 60
 
-    def test_query_too_large_has_counts(self):
+    def test_query_too_large_has_counts(self, sample_errors):
         """Test that QueryTooLargeError has count attributes."""
-        error = QueryTooLargeError(result_count=1000, max_results=500)
+        error = sample_errors[QueryTooLargeError]
         assert hasattr(error, 'result_count')
         assert hasattr(error, 'max_results')
         assert error.result_count == 1000
@@ -6,92 +6,150 @@ Requires actual Azure DevOps credentials and is marked with @pytest.mark.integra
 """
 
 import pytest
+import pytest_asyncio
 import os
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch
 from src.service_manager import ServiceManager
 from src.auth import AzureDevOpsAuth
 from src.services.sprint_service import SprintService
 from src.services.workitem_service import WorkItemService
 
 
-class TestMultiProjectServiceManager:
-    """Test ServiceManager with mocked services (unit-level integration)."""
+# Credentials/config for the real-integration tests, resolved once
+_ORG_URL = os.getenv("AZURE_DEVOPS_ORG_URL")
+_PROJECT = os.getenv("AZURE_DEVOPS_PROJECT")
+_PROJECT_2 = os.getenv("AZURE_DEVOPS_PROJECT_2")
 
-    @pytest.fixture
-    def mock_auth(self):
-        """Create mock authenticated auth."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        return auth
+# Attribute names of AzureDevOpsAuth, computed once. Passing a list spec to
+# Mock skips the per-instance dir() and coroutine-function scan of the class.
+_AUTH_SPEC = dir(AzureDevOpsAuth)
 
-    @pytest.fixture
-    def service_manager(self, mock_auth):
-        """Create ServiceManager with mock auth."""
-        return ServiceManager(mock_auth, default_project="DefaultProject")
 
-    def test_service_manager_creates_isolated_caches_per_project(self, service_manager):
-        """Test that each project gets its own cache namespace."""
-        with patch('src.service_manager.SprintService') as MockSprint:
-            # Create mock services
-            mock_svc1 = Mock()
-            mock_svc2 = Mock()
-            MockSprint.side_effect = [mock_svc1, mock_svc2]
+def _make_mock_auth():
+    """Create a mock auth restricted to AzureDevOpsAuth's attributes."""
+    auth = Mock(spec=_AUTH_SPEC)
+    auth.connection = Mock()
+    return auth
 
-            service1 = service_manager.get_sprint_service("Project1")
-            service2 = service_manager.get_sprint_service("Project2")
 
-            # Verify services created with correct projects
-            calls = MockSprint.call_args_list
-            assert calls[0][0][1] == "Project1"
-            assert calls[1][0][1] == "Project2"
+_SPRINT_DICT = {
+    'name': 'Sprint 1',
+    'start_date': '2024-01-01',
+    'end_date': '2024-01-15',
+    'days_remaining': 5,
+    'total_items': 10,
+    'completed_items': 5,
+    'in_progress_items': 3,
+    'not_started_items': 2,
+    'completion_percentage': 50.0
+}
 
-            # Services should be different instances
-            assert service1 is not service2
 
-    def test_service_manager_reuses_services_for_same_project(self, service_manager):
-        """Test that repeated calls for same project reuse service instance."""
-        with patch('src.service_manager.SprintService') as MockSprint:
-            mock_svc = Mock()
-            MockSprint.return_value = mock_svc
+async def _fake_current_sprint(*args, **kwargs):
+    """Async stand-in for SprintService.get_current_sprint."""
+    return _SPRINT_DICT
 
-            service1 = service_manager.get_sprint_service("Project1")
-            service2 = service_manager.get_sprint_service("Project1")
-            service3 = service_manager.get_sprint_service("Project1")
 
-            # Should only create once
-            assert MockSprint.call_count == 1
-            assert service1 is service2 is service3
+async def _fake_my_work_items(*args, **kwargs):
+    """Async stand-in for WorkItemService.get_my_work_items."""
+    return []
 
-            stats = service_manager.get_statistics()
-            assert stats['service_creations'] == 1
-            assert stats['cache_hits'] == 2
 
-    def test_service_manager_handles_multiple_projects_efficiently(self, service_manager):
-        """Test handling multiple projects with efficient caching."""
-        with patch('src.service_manager.SprintService') as MockSprint, \
-             patch('src.service_manager.WorkItemService') as MockWorkItem:
+@pytest.fixture(scope="class")
+def patched_service_classes():
+    """Patch the service classes once for every test in a class."""
+    with patch('src.service_manager.SprintService') as mock_sprint, \
+         patch('src.service_manager.WorkItemService') as mock_workitem:
+        yield mock_sprint, mock_workitem
 
-            MockSprint.side_effect = [Mock(), Mock(), Mock()]
-            MockWorkItem.side_effect = [Mock(), Mock(), Mock()]
 
-            # Create services for 3 projects
-            for project in ["Project1", "Project2", "Project3"]:
-                service_manager.get_sprint_service(project)
-                service_manager.get_workitem_service(project)
+@pytest.fixture
+def service_classes(patched_service_classes):
+    """Class-wide service class mocks, reset for the current test."""
+    for mock_cls in patched_service_classes:
+        mock_cls.reset_mock(return_value=True, side_effect=True)
+    return patched_service_classes
 
-            # Request them again (should be cached)
-            for project in ["Project1", "Project2", "Project3"]:
-                service_manager.get_sprint_service(project)
-                service_manager.get_workitem_service(project)
 
-            # Should create 3 of each type (6 total)
-            assert MockSprint.call_count == 3
-            assert MockWorkItem.call_count == 3
+class TestMultiProjectServiceManager:
+    """Test ServiceManager with mocked services (unit-level integration)."""
 
-            stats = service_manager.get_statistics()
-            assert stats['service_creations'] == 6
-            assert stats['cache_hits'] == 6  # 3 sprint + 3 workitem hits
-            assert stats['cache_hit_rate_percent'] == 50.0
+    @pytest.fixture(scope="class")
+    def mock_auth(self):
+        """Create mock authenticated auth."""
+        return _make_mock_auth()
+
+    @pytest.fixture(scope="class")
+    def service_manager(self, mock_auth):
+        """Create ServiceManager with mock auth."""
+        return ServiceManager(mock_auth, default_project="DefaultProject")
+
+    @pytest.fixture(autouse=True)
+    def reset_service_manager(self, service_manager):
+        """Start each test with no cached services and zeroed counters."""
+        service_manager.clear_all_services()
+        service_manager.reset_statistics()
+
+    @pytest.mark.parametrize("projects, expected_creations, expected_hits", [
+        # Repeated calls for the same project reuse one instance
+        (["Project1"] * 3, 1, 2),
+        # Each project gets its own service instance
+        (["Project1", "Project2"], 2, 0),
+        # Multiple projects are created once, then served from cache
+        (["Project1", "Project2", "Project3"] * 2, 3, 3),
+    ])
+    def test_service_manager_caches_services_per_project(
+        self, service_manager, service_classes,
+        projects, expected_creations, expected_hits
+    ):
+        """Test that services are created once per project and then reused."""
+        MockSprint, MockWorkItem = service_classes
+        MockSprint.side_effect = lambda auth, project: Mock()
+        MockWorkItem.side_effect = lambda auth, project: Mock()
+
+        sprint_services = {}
+        workitem_services = {}
+        for project in projects:
+            sprint_svc = service_manager.get_sprint_service(project)
+            workitem_svc = service_manager.get_workitem_service(project)
+
+            # Same project always yields the same instance
+            assert sprint_services.setdefault(project, sprint_svc) is sprint_svc
+            assert workitem_services.setdefault(project, workitem_svc) is workitem_svc
+
+        # Services should be different instances across projects
+        assert len({id(svc) for svc in sprint_services.values()}) == expected_creations
+
+        # Verify services created once each, with correct projects
+        unique_projects = list(dict.fromkeys(projects))
+        assert [c[0][1] for c in MockSprint.call_args_list] == unique_projects
+        assert [c[0][1] for c in MockWorkItem.call_args_list] == unique_projects
+
+        stats = service_manager.get_statistics()
+        assert stats['service_creations'] == 2 * expected_creations
+        assert stats['cache_hits'] == 2 * expected_hits
+        assert stats['cache_hit_rate_percent'] == round(
+            expected_hits / len(projects) * 100, 2
+        )
+
+    def test_service_manager_prewarms_multiple_projects(
+        self, service_manager, service_classes
+    ):
+        """Test batch-loading services for several projects."""
+        MockSprint, MockWorkItem = service_classes
+        projects = ["Project1", "Project2", "Project3"]
+
+        assert service_manager.prewarm(projects) == 6
+        assert service_manager.prewarm(projects) == 0
+
+        # Should create 3 of each type (6 total)
+        assert MockSprint.call_count == 3
+        assert MockWorkItem.call_count == 3
+        assert service_manager.get_loaded_projects() == projects
+
+        stats = service_manager.get_statistics()
+        assert stats['service_creations'] == 6
+        assert stats['cache_hits'] == 0
 
 
 class TestMultiProjectServerIntegration:
@@ -110,49 +168,39 @@ class TestMultiProjectServerIntegration:
         # This would test actual server tools with mocked service manager
         # Example structure:
 
-        mock_sprint_svc = AsyncMock()
+        mock_sprint_svc = Mock()
         mock_sprint_svc.project = "TestProject"
-        mock_sprint_svc.get_current_sprint = AsyncMock(return_value={
-            'name': 'Sprint 1',
-            'start_date': '2024-01-01',
-            'end_date': '2024-01-15',
-            'days_remaining': 5,
-            'total_items': 10,
-            'completed_items': 5,
-            'in_progress_items': 3,
-            'not_started_items': 2,
-            'completion_percentage': 50.0
-        })
+        mock_sprint_svc.get_current_sprint = _fake_current_sprint
 
         mock_service_manager.get_sprint_service.return_value = mock_sprint_svc
 
-        # Simulate tool call
-        with patch('src.server.service_manager', mock_service_manager):
-            # Would call actual tool here
-            # result = await get_current_sprint(project="TestProject")
-            pass
+        # Simulate tool call (with src.server.service_manager patched):
+        # result = await get_current_sprint(project="TestProject")
 
         # Verify service manager was called with correct project
         # mock_service_manager.get_sprint_service.assert_called_with("TestProject")
 
     def test_tools_use_default_project_when_not_specified(self, mock_service_manager):
         """Test that tools use default project when project not specified."""
-        mock_workitem_svc = AsyncMock()
+        mock_workitem_svc = Mock()
         mock_workitem_svc.project = "DefaultProject"
-        mock_workitem_svc.get_my_work_items = AsyncMock(return_value=[])
+        mock_workitem_svc.get_my_work_items = _fake_my_work_items
 
         mock_service_manager.get_workitem_service.return_value = mock_workitem_svc
 
-        with patch('src.server.service_manager', mock_service_manager):
-            # Would call actual tool without project parameter
-            # result = await get_my_work_items(state="Active")
-            pass
+        # Would call actual tool without project parameter
+        # (with src.server.service_manager patched):
+        # result = await get_my_work_items(state="Active")
 
         # Verify service manager was called with None (uses default)
         # mock_service_manager.get_workitem_service.assert_called_with(None)
 
 
 @pytest.mark.integration
+@pytest.mark.skipif(
+    not _ORG_URL or not _PROJECT,
+    reason="AZURE_DEVOPS_ORG_URL and AZURE_DEVOPS_PROJECT must be set"
+)
 class TestMultiProjectRealIntegration:
     """Integration tests with real Azure DevOps connection.
 
@@ -160,32 +208,30 @@ class TestMultiProjectRealIntegration:
     by default. Run with: pytest -m integration
     """
 
-    @pytest.fixture
+    @pytest_asyncio.fixture(scope="class", loop_scope="class")
     async def real_auth(self):
-        """Create real authenticated auth (requires credentials)."""
-        org_url = os.getenv("AZURE_DEVOPS_ORG_URL")
-        if not org_url:
-            pytest.skip("AZURE_DEVOPS_ORG_URL not set")
-
-        auth = AzureDevOpsAuth(org_url)
+        """Create real authenticated auth shared by the class (requires credentials)."""
+        auth = AzureDevOpsAuth(_ORG_URL)
         await auth.initialize()
         yield auth
         await auth.close()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def real_service_manager(self, real_auth):
-        """Create ServiceManager with real auth."""
-        default_project = os.getenv("AZURE_DEVOPS_PROJECT")
-        return ServiceManager(real_auth, default_project=default_project)
+        """Create ServiceManager with real auth shared by the class."""
+        return ServiceManager(real_auth, default_project=_PROJECT)
+
+    @pytest.fixture(autouse=True)
+    def reset_real_service_manager(self, real_service_manager):
+        """Start each test with no cached services and zeroed counters."""
+        real_service_manager.clear_all_services()
+        real_service_manager.reset_statistics()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_real_multi_project_service_creation(self, real_service_manager):
         """Test creating real services for multiple projects."""
-        project1 = os.getenv("AZURE_DEVOPS_PROJECT")
-        project2 = os.getenv("AZURE_DEVOPS_PROJECT_2", project1)  # Use same if not set
-
-        if not project1:
-            pytest.skip("AZURE_DEVOPS_PROJECT not set")
+        project1 = _PROJECT
+        project2 = _PROJECT_2 or _PROJECT  # Use same if not set
 
         # Create services for both projects
         sprint_svc1 = real_service_manager.get_sprint_service(project1)
@@ -203,12 +249,10 @@ class TestMultiProjectRealIntegration:
         if project1 != project2:
             assert sprint_svc1 is not sprint_svc2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_real_service_caching_across_types(self, real_service_manager):
         """Test that service caching works correctly across service types."""
-        project = os.getenv("AZURE_DEVOPS_PROJECT")
-        if not project:
-            pytest.skip("AZURE_DEVOPS_PROJECT not set")
+        project = _PROJECT
 
         # Get both service types for same project
         sprint_svc1 = real_service_manager.get_sprint_service(project)
@@ -231,12 +275,10 @@ class TestMultiProjectRealIntegration:
         assert stats['cache_hits'] == 2
         assert stats['cache_hit_rate_percent'] == 50.0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_real_service_manager_statistics(self, real_service_manager):
         """Test service manager statistics with real services."""
-        project = os.getenv("AZURE_DEVOPS_PROJECT")
-        if not project:
-            pytest.skip("AZURE_DEVOPS_PROJECT not set")
+        project = _PROJECT
 
         # Initial state
         initial_stats = real_service_manager.get_statistics()
@@ -255,14 +297,11 @@ class TestMultiProjectRealIntegration:
         assert stats['total_services'] == 2
         assert project in real_service_manager.get_loaded_projects()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_real_services_have_isolated_caches(self, real_service_manager):
         """Test that services for different projects have isolated caches."""
-        project1 = os.getenv("AZURE_DEVOPS_PROJECT")
-        project2 = os.getenv("AZURE_DEVOPS_PROJECT_2", f"{project1}_alt")
-
-        if not project1:
-            pytest.skip("AZURE_DEVOPS_PROJECT not set")
+        project1 = _PROJECT
+        project2 = _PROJECT_2 or f"{project1}_alt"
 
         sprint_svc1 = real_service_manager.get_sprint_service(project1)
         sprint_svc2 = real_service_manager.get_sprint_service(project2)
@@ -279,25 +318,21 @@ class TestMultiProjectRealIntegration:
 class TestMultiProjectErrorHandling:
     """Test error handling in multi-project scenarios."""
 
-    def test_service_manager_validates_project_name(self):
+    @pytest.mark.parametrize("getter", ["get_sprint_service", "get_workitem_service"])
+    def test_service_manager_validates_project_name(self, getter):
         """Test that service manager validates project names."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+        auth = _make_mock_auth()
         manager = ServiceManager(auth)  # No default project
 
         from src.validation import ValidationError
 
         # Should raise when no project specified and no default
         with pytest.raises(ValidationError):
-            manager.get_sprint_service()
-
-        with pytest.raises(ValidationError):
-            manager.get_workitem_service()
+            getattr(manager, getter)()
 
     def test_service_manager_handles_whitespace_in_project_names(self):
         """Test that service manager strips whitespace from project names."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+        auth = _make_mock_auth()
         manager = ServiceManager(auth)
 
         with patch('src.service_manager.SprintService') as MockSprint:
@@ -310,8 +345,7 @@ class TestMultiProjectErrorHandling:
 
     def test_clearing_services_doesnt_affect_statistics(self):
         """Test that clearing services preserves creation statistics."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+        auth = _make_mock_auth()
         manager = ServiceManager(auth)
 
         with patch('src.service_manager.SprintService'):
@@ -319,16 +353,13 @@ class TestMultiProjectErrorHandling:
             manager.get_sprint_service("Project1")
             manager.get_sprint_service("Project2")
 
-            stats_before = manager.get_statistics()
-            creations_before = stats_before['service_creations']
-
             # Clear services
             manager.clear_all_services()
 
             stats_after = manager.get_statistics()
 
             # Statistics should be preserved
-            assert stats_after['service_creations'] == creations_before
+            assert stats_after['service_creations'] == 2
             # But active services should be cleared
             assert stats_after['total_services'] == 0
 
@@ -336,47 +367,38 @@ class TestMultiProjectErrorHandling:
 class TestMultiProjectPerformance:
     """Test performance characteristics of multi-project support."""
 
-    def test_service_creation_is_lazy(self):
+    def test_service_creation_is_lazy(self, service_classes):
         """Test that services are only created when requested."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+        MockSprint, _ = service_classes
+        auth = _make_mock_auth()
         manager = ServiceManager(auth, default_project="DefaultProject")
 
-        with patch('src.service_manager.SprintService') as MockSprint:
-            # Just creating manager shouldn't create any services
-            assert MockSprint.call_count == 0
+        # Just creating manager shouldn't create any services
+        assert MockSprint.call_count == 0
 
-            # Only creates when requested
-            manager.get_sprint_service("Project1")
-            assert MockSprint.call_count == 1
+        # Only creates when requested
+        manager.get_sprint_service("Project1")
+        assert MockSprint.call_count == 1
 
-    def test_cache_hit_rate_with_mixed_usage(self):
+    def test_cache_hit_rate_with_mixed_usage(self, service_classes):
         """Test cache hit rate with realistic mixed usage pattern."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+        auth = _make_mock_auth()
         manager = ServiceManager(auth)
 
-        with patch('src.service_manager.SprintService'):
-            # Simulate realistic usage:
-            # - Work with Project1 frequently
-            # - Occasionally switch to Project2
-            # - Rarely use Project3
-
-            manager.get_sprint_service("Project1")  # Create
-            for _ in range(50):  # Hit cache 50 times
-                manager.get_sprint_service("Project1")
-
-            manager.get_sprint_service("Project2")  # Create
-            for _ in range(10):  # Hit cache 10 times
-                manager.get_sprint_service("Project2")
-
-            manager.get_sprint_service("Project3")  # Create
-            for _ in range(2):  # Hit cache 2 times
-                manager.get_sprint_service("Project3")
-
-            stats = manager.get_statistics()
-
-            # 3 creations, 62 cache hits = 95.4% hit rate
-            assert stats['service_creations'] == 3
-            assert stats['cache_hits'] == 62
-            assert stats['cache_hit_rate_percent'] > 95.0
+        # Simulate realistic usage:
+        # - Work with Project1 frequently (1 create + 50 cache hits)
+        # - Occasionally switch to Project2 (1 create + 10 cache hits)
+        # - Rarely use Project3 (1 create + 2 cache hits)
+        requests = (
+            ["Project1"] * 51 +
+            ["Project2"] * 11 +
+            ["Project3"] * 3
+        )
+        list(map(manager.get_sprint_service, requests))
+
+        stats = manager.get_statistics()
+
+        # 3 creations, 62 cache hits = 95.4% hit rate
+        assert stats['service_creations'] == 3
+        assert stats['cache_hits'] == 62
+        assert stats['cache_hit_rate_percent'] > 95.0
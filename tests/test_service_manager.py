@@ -2,35 +2,78 @@
 Unit tests for ServiceManager module.
 
 Tests multi-project service management, lazy loading, caching, and statistics.
+
+Safe under pytest-xdist (-n auto): no test mutates module-level state, and
+the module/class-scoped fixtures (shared auth mock, resolution managers) are
+only read.
 """
 
+import re
 import pytest
-from unittest.mock import Mock, MagicMock, AsyncMock, patch
+from unittest.mock import Mock
 from src.service_manager import ServiceManager
 from src.auth import AzureDevOpsAuth
 from src.validation import ValidationError
 
 
+_PROJECT_REQUIRED_RE = re.compile("Project name is required")
+
+
+def _preload(manager, sprint=(), workitem=()):
+    """Request sprint and work item services for the given projects."""
+    get_sprint, get_workitem = manager.get_sprint_service, manager.get_workitem_service
+    for project in sprint:
+        get_sprint(project)
+    for project in workitem:
+        get_workitem(project)
+
+
+@pytest.fixture(scope="module")
+def auth():
+    """Initialized mock auth shared by every test in this module."""
+    auth = Mock(spec=AzureDevOpsAuth)
+    auth.connection = Mock()  # Simulate initialized auth
+    return auth
+
+
+@pytest.fixture
+def mock_sprint_service(monkeypatch):
+    """Replace SprintService in the service manager module with a mock."""
+    mock_cls = Mock()
+    monkeypatch.setattr("src.service_manager.SprintService", mock_cls)
+    return mock_cls
+
+
+@pytest.fixture
+def mock_workitem_service(monkeypatch):
+    """Replace WorkItemService in the service manager module with a mock."""
+    mock_cls = Mock()
+    monkeypatch.setattr("src.service_manager.WorkItemService", mock_cls)
+    return mock_cls
+
+
+@pytest.fixture
+def manager_with_three_projects(auth, mock_sprint_service, mock_workitem_service):
+    """Manager with sprint services for Project1/2 and work item services for Project2/3."""
+    manager = ServiceManager(auth)
+    _preload(manager, sprint=["Project1", "Project2"], workitem=["Project2", "Project3"])
+    return manager
+
+
 class TestServiceManagerInitialization:
     """Test ServiceManager initialization."""
 
-    def test_initialization_with_auth_and_default_project(self):
+    def test_initialization_with_auth_and_default_project(self, auth):
         """Test creating ServiceManager with auth and default project."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()  # Simulate initialized auth
-
         manager = ServiceManager(auth, default_project="TestProject")
 
         assert manager.auth == auth
         assert manager.default_project == "TestProject"
-        assert len(manager._sprint_services) == 0
-        assert len(manager._workitem_services) == 0
+        assert not manager._sprint_services
+        assert not manager._workitem_services
 
-    def test_initialization_without_default_project(self):
+    def test_initialization_without_default_project(self, auth):
         """Test creating ServiceManager without default project."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-
         manager = ServiceManager(auth)
 
         assert manager.auth == auth
@@ -38,7 +81,7 @@ class TestServiceManagerInitialization:
 
     def test_initialization_requires_initialized_auth(self):
         """Test that ServiceManager requires initialized auth."""
-        auth = Mock(spec=AzureDevOpsAuth)
+        auth = Mock()
         auth.connection = None  # Not initialized
 
         with pytest.raises(ValueError, match="initialized AzureDevOpsAuth"):
@@ -50,332 +93,230 @@ class TestServiceManagerInitialization:
             ServiceManager(None)
 
 
-class TestServiceManagerSprintService:
-    """Test ServiceManager sprint service management."""
+class TestServiceManagerGetService:
+    """Test ServiceManager sprint and work item service management."""
+
+    @pytest.fixture(params=[
+        pytest.param(("sprint", "SprintService", "_sprint_services"), id="sprint"),
+        pytest.param(("workitem", "WorkItemService", "_workitem_services"), id="workitem"),
+    ])
+    def service_kind(self, request, monkeypatch):
+        """Patch one service class and return (kind, mock class, cache attribute)."""
+        kind, class_name, cache_attr = request.param
+        mock_cls = Mock()
+        monkeypatch.setattr(f"src.service_manager.{class_name}", mock_cls)
+        return kind, mock_cls, cache_attr
 
-    def test_get_sprint_service_creates_new_instance(self):
-        """Test getting sprint service creates new instance."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+    def test_get_service_creates_new_instance(self, auth, service_kind):
+        """Test getting a service creates new instance."""
+        kind, MockService, cache_attr = service_kind
         manager = ServiceManager(auth, default_project="DefaultProject")
 
-        with patch('src.service_manager.SprintService') as MockService:
-            mock_instance = Mock()
-            MockService.return_value = mock_instance
+        mock_instance = Mock()
+        MockService.return_value = mock_instance
 
-            service = manager.get_sprint_service("TestProject")
+        service = getattr(manager, f"get_{kind}_service")("TestProject")
 
-            MockService.assert_called_once_with(auth, "TestProject")
-            assert service == mock_instance
-            assert "TestProject" in manager._sprint_services
-            assert manager._service_creation_count == 1
+        MockService.assert_called_once_with(auth, "TestProject")
+        assert service == mock_instance
+        assert "TestProject" in getattr(manager, cache_attr)
+        assert manager._service_creation_count == 1
 
-    def test_get_sprint_service_returns_cached_instance(self):
-        """Test getting sprint service returns cached instance."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+    def test_get_service_returns_cached_instance(self, auth, service_kind):
+        """Test getting a service returns cached instance."""
+        kind, MockService, _ = service_kind
         manager = ServiceManager(auth)
-
-        with patch('src.service_manager.SprintService') as MockService:
-            mock_instance = Mock()
-            MockService.return_value = mock_instance
-
-            # First call creates instance
-            service1 = manager.get_sprint_service("TestProject")
-            # Second call returns cached
-            service2 = manager.get_sprint_service("TestProject")
-
-            # Should only create once
-            assert MockService.call_count == 1
-            assert service1 is service2
-            assert manager._service_creation_count == 1
-            assert manager._cache_hit_count == 1
-
-    def test_get_sprint_service_uses_default_project(self):
-        """Test getting sprint service uses default project when not specified."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+        get_service = getattr(manager, f"get_{kind}_service")
+
+        # First call creates instance
+        service1 = get_service("TestProject")
+        # Second call returns cached
+        service2 = get_service("TestProject")
+
+        # Should only create once
+        assert MockService.call_count == 1
+        assert service1 is service2
+        assert manager._service_creation_count == 1
+        assert manager._cache_hit_count == 1
+
+    def test_get_service_uses_default_project(self, auth, service_kind):
+        """Test getting a service uses default project when not specified."""
+        kind, MockService, _ = service_kind
         manager = ServiceManager(auth, default_project="DefaultProject")
 
-        with patch('src.service_manager.SprintService') as MockService:
-            mock_instance = Mock()
-            MockService.return_value = mock_instance
+        getattr(manager, f"get_{kind}_service")()
 
-            service = manager.get_sprint_service()
+        MockService.assert_called_once_with(auth, "DefaultProject")
 
-            MockService.assert_called_once_with(auth, "DefaultProject")
-
-    def test_get_sprint_service_raises_without_project_or_default(self):
-        """Test getting sprint service raises error without project or default."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+    def test_get_service_raises_without_project_or_default(self, auth, service_kind):
+        """Test getting a service raises error without project or default."""
+        kind, _, _ = service_kind
         manager = ServiceManager(auth)  # No default project
 
-        with pytest.raises(ValidationError, match="Project name is required"):
-            manager.get_sprint_service()
-
-    def test_get_sprint_service_multiple_projects(self):
-        """Test getting sprint services for multiple projects."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth)
-
-        with patch('src.service_manager.SprintService') as MockService:
-            MockService.side_effect = [Mock(), Mock(), Mock()]
-
-            service1 = manager.get_sprint_service("Project1")
-            service2 = manager.get_sprint_service("Project2")
-            service3 = manager.get_sprint_service("Project3")
+        with pytest.raises(ValidationError, match=_PROJECT_REQUIRED_RE):
+            getattr(manager, f"get_{kind}_service")()
 
-            assert service1 is not service2
-            assert service2 is not service3
-            assert len(manager._sprint_services) == 3
-            assert manager._service_creation_count == 3
-
-
-class TestServiceManagerWorkItemService:
-    """Test ServiceManager work item service management."""
-
-    def test_get_workitem_service_creates_new_instance(self):
-        """Test getting work item service creates new instance."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
+    def test_get_service_multiple_projects(self, auth, service_kind):
+        """Test getting services for multiple projects."""
+        kind, MockService, cache_attr = service_kind
         manager = ServiceManager(auth)
+        get_service = getattr(manager, f"get_{kind}_service")
 
-        with patch('src.service_manager.WorkItemService') as MockService:
-            mock_instance = Mock()
-            MockService.return_value = mock_instance
-
-            service = manager.get_workitem_service("TestProject")
-
-            MockService.assert_called_once_with(auth, "TestProject")
-            assert service == mock_instance
-            assert "TestProject" in manager._workitem_services
-            assert manager._service_creation_count == 1
-
-    def test_get_workitem_service_returns_cached_instance(self):
-        """Test getting work item service returns cached instance."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth, default_project="TestProject")
-
-        with patch('src.service_manager.WorkItemService') as MockService:
-            mock_instance = Mock()
-            MockService.return_value = mock_instance
-
-            service1 = manager.get_workitem_service()
-            service2 = manager.get_workitem_service()
-
-            assert MockService.call_count == 1
-            assert service1 is service2
-            assert manager._cache_hit_count == 1
-
-    def test_get_workitem_service_uses_default_project(self):
-        """Test getting work item service uses default project."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth, default_project="DefaultProject")
-
-        with patch('src.service_manager.WorkItemService') as MockService:
-            mock_instance = Mock()
-            MockService.return_value = mock_instance
-
-            service = manager.get_workitem_service()
+        MockService.side_effect = lambda *args, **kwargs: Mock()
 
-            MockService.assert_called_once_with(auth, "DefaultProject")
+        service1 = get_service("Project1")
+        service2 = get_service("Project2")
+        service3 = get_service("Project3")
 
-    def test_get_workitem_service_raises_without_project_or_default(self):
-        """Test getting work item service raises error without project."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth)
-
-        with pytest.raises(ValidationError, match="Project name is required"):
-            manager.get_workitem_service()
+        assert service1 is not service2
+        assert service2 is not service3
+        assert getattr(manager, cache_attr).keys() == {"Project1", "Project2", "Project3"}
+        assert manager._service_creation_count == 3
 
 
 class TestServiceManagerMixedServices:
     """Test ServiceManager with both sprint and work item services."""
 
-    def test_different_services_for_same_project(self):
+    def test_different_services_for_same_project(
+        self, auth, mock_sprint_service, mock_workitem_service
+    ):
         """Test getting different service types for same project."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
         manager = ServiceManager(auth)
 
-        with patch('src.service_manager.SprintService') as MockSprint, \
-             patch('src.service_manager.WorkItemService') as MockWorkItem:
-
-            mock_sprint = Mock()
-            mock_workitem = Mock()
-            MockSprint.return_value = mock_sprint
-            MockWorkItem.return_value = mock_workitem
+        mock_sprint_service.side_effect = lambda *args, **kwargs: Mock()
+        mock_workitem_service.side_effect = lambda *args, **kwargs: Mock()
 
-            sprint_svc = manager.get_sprint_service("TestProject")
-            workitem_svc = manager.get_workitem_service("TestProject")
+        sprint_svc = manager.get_sprint_service("TestProject")
+        workitem_svc = manager.get_workitem_service("TestProject")
 
-            assert sprint_svc is not workitem_svc
-            assert len(manager._sprint_services) == 1
-            assert len(manager._workitem_services) == 1
-            assert manager._service_creation_count == 2
+        assert sprint_svc is not workitem_svc
+        assert manager._sprint_services.keys() == {"TestProject"}
+        assert manager._workitem_services.keys() == {"TestProject"}
+        assert manager._service_creation_count == 2
 
-    def test_services_cached_independently(self):
+    def test_services_cached_independently(self, auth, mock_sprint_service, mock_workitem_service):
         """Test that sprint and work item services are cached independently."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
         manager = ServiceManager(auth)
 
-        with patch('src.service_manager.SprintService') as MockSprint, \
-             patch('src.service_manager.WorkItemService') as MockWorkItem:
+        # Create both service types for same project
+        _preload(manager, sprint=["Project1"], workitem=["Project1"])
 
-            MockSprint.return_value = Mock()
-            MockWorkItem.return_value = Mock()
+        # Get them again (should be cached)
+        _preload(manager, sprint=["Project1"], workitem=["Project1"])
 
-            # Create both service types for same project
-            manager.get_sprint_service("Project1")
-            manager.get_workitem_service("Project1")
-
-            # Get them again (should be cached)
-            manager.get_sprint_service("Project1")
-            manager.get_workitem_service("Project1")
-
-            # Each type created only once
-            assert MockSprint.call_count == 1
-            assert MockWorkItem.call_count == 1
-            assert manager._cache_hit_count == 2
+        # Each type created only once
+        assert mock_sprint_service.call_count == 1
+        assert mock_workitem_service.call_count == 1
+        assert manager._cache_hit_count == 2
 
 
 class TestServiceManagerProjectResolution:
     """Test ServiceManager project name resolution."""
 
-    def test_resolve_project_with_explicit_parameter(self):
-        """Test resolving project with explicit parameter."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth, default_project="Default")
+    @pytest.fixture(scope="class")
+    def manager_with_default(self, auth):
+        """Shared manager with a default project (resolution is read-only)."""
+        return ServiceManager(auth, default_project="DefaultProject")
 
-        resolved = manager._resolve_project("ExplicitProject")
+    @pytest.fixture(scope="class")
+    def manager_no_default(self, auth):
+        """Shared manager without a default project."""
+        return ServiceManager(auth)
+
+    def test_resolve_project_with_explicit_parameter(self, manager_with_default):
+        """Test resolving project with explicit parameter."""
+        resolved = manager_with_default._resolve_project("ExplicitProject")
         assert resolved == "ExplicitProject"
 
-    def test_resolve_project_with_default(self):
+    def test_resolve_project_with_default(self, manager_with_default):
         """Test resolving project falls back to default."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth, default_project="DefaultProject")
-
-        resolved = manager._resolve_project(None)
+        resolved = manager_with_default._resolve_project(None)
         assert resolved == "DefaultProject"
 
-    def test_resolve_project_strips_whitespace(self):
+    def test_resolve_project_strips_whitespace(self, manager_no_default):
         """Test resolving project strips whitespace."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth)
-
-        resolved = manager._resolve_project("  ProjectWithSpaces  ")
+        resolved = manager_no_default._resolve_project("  ProjectWithSpaces  ")
         assert resolved == "ProjectWithSpaces"
 
-    def test_resolve_project_raises_without_default(self):
+    def test_resolve_project_raises_without_default(self, manager_no_default):
         """Test resolving project raises error without default."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth)
-
-        with pytest.raises(ValidationError, match="Project name is required"):
-            manager._resolve_project(None)
+        with pytest.raises(ValidationError, match=_PROJECT_REQUIRED_RE):
+            manager_no_default._resolve_project(None)
 
 
 class TestServiceManagerUtilityMethods:
     """Test ServiceManager utility methods."""
 
-    def test_get_loaded_projects_empty(self):
+    def test_get_loaded_projects_empty(self, auth):
         """Test getting loaded projects when none exist."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
         manager = ServiceManager(auth)
 
         projects = manager.get_loaded_projects()
         assert projects == []
 
-    def test_get_loaded_projects_with_services(self):
+    def test_get_loaded_projects_with_services(self, manager_with_three_projects):
         """Test getting loaded projects with active services."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth)
-
-        with patch('src.service_manager.SprintService'), \
-             patch('src.service_manager.WorkItemService'):
-
-            manager.get_sprint_service("Project1")
-            manager.get_sprint_service("Project2")
-            manager.get_workitem_service("Project2")
-            manager.get_workitem_service("Project3")
+        projects = manager_with_three_projects.get_loaded_projects()
 
-            projects = manager.get_loaded_projects()
+        # Should return unique projects, sorted
+        assert projects == ["Project1", "Project2", "Project3"]
 
-            # Should return unique projects, sorted
-            assert projects == ["Project1", "Project2", "Project3"]
-
-    def test_clear_project_services(self):
+    def test_clear_project_services(self, manager_with_three_projects):
         """Test clearing services for specific project."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth)
+        manager = manager_with_three_projects
 
-        with patch('src.service_manager.SprintService'), \
-             patch('src.service_manager.WorkItemService'):
+        # Project2 has both a sprint and a work item service
+        manager.clear_project_services("Project2")
 
-            manager.get_sprint_service("Project1")
-            manager.get_workitem_service("Project1")
-            manager.get_sprint_service("Project2")
+        assert manager.get_loaded_projects() == ["Project1", "Project3"]
+        assert "Project2" not in manager._sprint_services
+        assert "Project2" not in manager._workitem_services
 
-            assert len(manager.get_loaded_projects()) == 2
-
-            manager.clear_project_services("Project1")
-
-            assert len(manager.get_loaded_projects()) == 1
-            assert "Project2" in manager.get_loaded_projects()
-            assert "Project1" not in manager._sprint_services
-            assert "Project1" not in manager._workitem_services
-
-    def test_clear_project_services_nonexistent(self):
+    def test_clear_project_services_nonexistent(self, auth):
         """Test clearing services for nonexistent project doesn't error."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
         manager = ServiceManager(auth)
 
         # Should not raise error
         manager.clear_project_services("NonExistent")
 
-    def test_clear_all_services(self):
+    def test_clear_all_services(self, manager_with_three_projects):
         """Test clearing all services."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth)
+        manager = manager_with_three_projects
 
-        with patch('src.service_manager.SprintService'), \
-             patch('src.service_manager.WorkItemService'):
+        manager.clear_all_services()
 
-            manager.get_sprint_service("Project1")
-            manager.get_sprint_service("Project2")
-            manager.get_workitem_service("Project3")
+        assert len(manager.get_loaded_projects()) == 0
+        assert not manager._sprint_services
+        assert not manager._workitem_services
 
-            assert len(manager.get_loaded_projects()) == 3
+    def test_prewarm_creates_services_for_projects(
+        self, auth, mock_sprint_service, mock_workitem_service
+    ):
+        """Test prewarming creates both service types once per project."""
+        manager = ServiceManager(auth)
 
-            manager.clear_all_services()
+        manager.get_sprint_service("Project1")
 
-            assert len(manager.get_loaded_projects()) == 0
-            assert len(manager._sprint_services) == 0
-            assert len(manager._workitem_services) == 0
+        created = manager.prewarm(["Project1", " Project2 "])
+
+        # Project1 sprint service already existed
+        assert created == 3
+        assert mock_sprint_service.call_count == 2
+        assert mock_workitem_service.call_count == 2
+        assert manager.get_loaded_projects() == ["Project1", "Project2"]
+
+        # Second prewarm is a no-op and doesn't count cache hits
+        assert manager.prewarm(["Project1", "Project2"]) == 0
+        stats = manager.get_statistics()
+        assert stats['service_creations'] == 4
+        assert stats['cache_hits'] == 0
 
 
 class TestServiceManagerStatistics:
     """Test ServiceManager statistics tracking."""
 
-    def test_statistics_initial_state(self):
+    def test_statistics_initial_state(self, auth):
         """Test statistics in initial state."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
         manager = ServiceManager(auth, default_project="TestProject")
 
         stats = manager.get_statistics()
@@ -389,95 +330,84 @@ class TestServiceManagerStatistics:
         assert stats['cache_hit_rate_percent'] == 0.0
         assert stats['default_project'] == "TestProject"
 
-    def test_statistics_after_service_creation(self):
+    def test_statistics_after_service_creation(
+        self, auth, mock_sprint_service, mock_workitem_service
+    ):
         """Test statistics after creating services."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
         manager = ServiceManager(auth)
 
-        with patch('src.service_manager.SprintService'), \
-             patch('src.service_manager.WorkItemService'):
+        _preload(manager, sprint=["Project1", "Project2"], workitem=["Project1"])
 
-            manager.get_sprint_service("Project1")
-            manager.get_sprint_service("Project2")
-            manager.get_workitem_service("Project1")
-
-            stats = manager.get_statistics()
+        stats = manager.get_statistics()
 
-            assert stats['loaded_projects'] == 2
-            assert stats['sprint_services'] == 2
-            assert stats['workitem_services'] == 1
-            assert stats['total_services'] == 3
-            assert stats['service_creations'] == 3
-            assert stats['cache_hits'] == 0
+        assert stats['loaded_projects'] == 2
+        assert stats['sprint_services'] == 2
+        assert stats['workitem_services'] == 1
+        assert stats['total_services'] == 3
+        assert stats['service_creations'] == 3
+        assert stats['cache_hits'] == 0
 
-    def test_statistics_cache_hit_rate(self):
+    def test_statistics_cache_hit_rate(self, auth, mock_sprint_service):
         """Test statistics cache hit rate calculation."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
         manager = ServiceManager(auth)
 
-        with patch('src.service_manager.SprintService'):
-            # 1 creation
-            manager.get_sprint_service("Project1")
-            # 9 cache hits
-            for _ in range(9):
-                manager.get_sprint_service("Project1")
+        # 1 creation; cache hit counting is covered by the getter tests,
+        # so inject 9 hits directly to exercise the rate calculation
+        manager.get_sprint_service("Project1")
+        manager._cache_hit_count = 9
 
-            stats = manager.get_statistics()
+        stats = manager.get_statistics()
 
-            # 9 hits out of 10 total = 90%
-            assert stats['service_creations'] == 1
-            assert stats['cache_hits'] == 9
-            assert stats['cache_hit_rate_percent'] == 90.0
+        # 9 hits out of 10 total = 90%
+        assert stats['service_creations'] == 1
+        assert stats['cache_hits'] == 9
+        assert stats['cache_hit_rate_percent'] == 90.0
 
-    def test_statistics_after_clear(self):
+    def test_statistics_after_clear(self, auth, mock_sprint_service):
         """Test statistics after clearing services."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
         manager = ServiceManager(auth)
 
-        with patch('src.service_manager.SprintService'):
-            manager.get_sprint_service("Project1")
-            manager.clear_all_services()
+        manager.get_sprint_service("Project1")
+        manager.clear_all_services()
 
-            stats = manager.get_statistics()
+        stats = manager.get_statistics()
 
-            # Counts persist, but active services cleared
-            assert stats['loaded_projects'] == 0
-            assert stats['sprint_services'] == 0
-            assert stats['total_services'] == 0
-            assert stats['service_creations'] == 1  # History preserved
+        # Counts persist, but active services cleared
+        assert stats['loaded_projects'] == 0
+        assert stats['sprint_services'] == 0
+        assert stats['total_services'] == 0
+        assert stats['service_creations'] == 1  # History preserved
+
+    def test_reset_statistics(self, auth, mock_sprint_service):
+        """Test resetting counters keeps cached services."""
+        manager = ServiceManager(auth)
+
+        manager.get_sprint_service("Project1")
+        manager.get_sprint_service("Project1")
+        manager.reset_statistics()
+
+        stats = manager.get_statistics()
+
+        assert stats['service_creations'] == 0
+        assert stats['cache_hits'] == 0
+        assert stats['cache_hit_rate_percent'] == 0.0
+        assert stats['sprint_services'] == 1
 
 
 class TestServiceManagerStringRepresentation:
     """Test ServiceManager string representation."""
 
-    def test_repr_with_default_project(self):
+    def test_repr_with_default_project(self, auth):
         """Test __repr__ with default project."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
         manager = ServiceManager(auth, default_project="TestProject")
 
-        repr_str = repr(manager)
-
-        assert "ServiceManager" in repr_str
-        assert "default='TestProject'" in repr_str
+        assert repr(manager) == (
+            "ServiceManager(projects=0, services=0, default='TestProject')"
+        )
 
-    def test_repr_with_services(self):
+    def test_repr_with_services(self, manager_with_three_projects):
         """Test __repr__ with loaded services."""
-        auth = Mock(spec=AzureDevOpsAuth)
-        auth.connection = Mock()
-        manager = ServiceManager(auth)
-
-        with patch('src.service_manager.SprintService'), \
-             patch('src.service_manager.WorkItemService'):
-
-            manager.get_sprint_service("Project1")
-            manager.get_workitem_service("Project1")
-
-            repr_str = repr(manager)
-
-            # Both services are for same project, so should be 1 unique project
-            assert "projects=1" in repr_str
-            assert "services=2" in repr_str
+        # Project2 has both service types, so 3 unique projects
+        assert repr(manager_with_three_projects) == (
+            "ServiceManager(projects=3, services=4, default='None')"
+        )
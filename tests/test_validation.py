@@ -4,18 +4,23 @@ Unit tests for validation module.
 Tests whitelist validation, WIQL syntax validation, and input sanitization.
 """
 
+import sys
+import time
 import pytest
 from src.validation import (
     validate_state,
     validate_work_item_type,
     validate_field_name,
+    validate_fields_batch,
     validate_iteration_path,
     validate_wiql,
     ValidationError,
     WiqlValidator,
     ALLOWED_STATES,
     ALLOWED_WORK_ITEM_TYPES,
-    ALLOWED_FIELD_NAMES as ALLOWED_FIELDS
+    STATES_BY_WORK_ITEM_TYPE,
+    ALLOWED_FIELD_NAMES as ALLOWED_FIELDS,
+    _ALLOWED_FIELD_PREFIXES
 )
 
 
@@ -60,6 +65,42 @@ class TestStateValidation:
         with pytest.raises(ValidationError):
             validate_state("Active; DROP TABLE workitems;--")
 
+    def test_validate_state_for_work_item_type(self):
+        """Test that a known type narrows the allowed states."""
+        assert validate_state('To Do', 'Task') == 'To Do'
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_state('Development', 'Task')
+
+        assert 'Invalid state for Task' in str(exc_info.value)
+        assert 'Development' in ALLOWED_STATES
+
+    def test_validate_state_unknown_type_uses_all_states(self):
+        """Test that types without a state set fall back to ALLOWED_STATES."""
+        assert validate_state('Development', 'Test Case') == 'Development'
+
+    def test_validate_custom_process_state_for_every_type(self):
+        """Test that custom-process states are accepted for every known type."""
+        for work_item_type in STATES_BY_WORK_ITEM_TYPE:
+            assert validate_state('Ready', work_item_type) == 'Ready'
+            assert validate_state('In Review', work_item_type) == 'In Review'
+
+    def test_validate_state_for_type_case_insensitive(self):
+        """Test canonical casing is resolved within the narrowed set."""
+        assert validate_state('in progress', 'Task') == 'In Progress'
+
+        with pytest.raises(ValidationError):
+            validate_state('approved', 'User Story')
+
+    def test_validate_state_for_lowercase_type(self):
+        """Test that the type is matched case-insensitively before narrowing."""
+        assert validate_state('Done', 'product backlog item') == 'Done'
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_state('Closed', 'product backlog item')
+
+        assert 'Invalid state for Product Backlog Item' in str(exc_info.value)
+
 
 class TestWorkItemTypeValidation:
     """Test work item type validation."""
@@ -117,6 +158,43 @@ class TestFieldNameValidation:
             validate_field_name("System.Id'; DROP TABLE--")
 
 
+class TestFieldsBatchValidation:
+    """Test batch validation of field name/value mappings."""
+
+    def test_prefixed_names_are_preserved(self):
+        """Test that '/fields/'-prefixed keys keep their original names."""
+        result = validate_fields_batch({
+            '/fields/System.Title': 'Fix login',
+            'Microsoft.VSTS.Common.Priority': 2,
+        })
+
+        assert result == {
+            '/fields/System.Title': 'Fix login',
+            'Microsoft.VSTS.Common.Priority': 2,
+        }
+
+    def test_invalid_field_name_rejected(self):
+        """Test that a non-whitelisted name raises ValidationError."""
+        with pytest.raises(ValidationError):
+            validate_fields_batch({'System.Title': 'ok', 'Custom.Field': 'x'})
+
+    def test_html_values_are_sanitized(self):
+        """Test that HTML fields run through the HTML sanitizer."""
+        result = validate_fields_batch({'/fields/System.Description': 'a\x00b'})
+        assert result == {'/fields/System.Description': 'ab'}
+
+        with pytest.raises(ValidationError):
+            validate_fields_batch({'System.Description': '<script>alert(1)</script>'})
+
+    def test_numeric_values_are_checked(self):
+        """Test that numeric fields reject negative and non-numeric values."""
+        with pytest.raises(ValidationError):
+            validate_fields_batch({'Microsoft.VSTS.Scheduling.RemainingWork': -1})
+
+        with pytest.raises(ValidationError):
+            validate_fields_batch({'/fields/Microsoft.VSTS.Scheduling.StoryPoints': 'five'})
+
+
 class TestIterationPathValidation:
     """Test iteration path validation."""
 
@@ -237,6 +315,24 @@ class TestWiqlValidation:
         assert 'exceeds maximum length' in str(exc_info.value)
         assert '32768' in str(exc_info.value)
 
+    def test_repeated_select_rejected_in_linear_time(self):
+        """Test that a max-length query of repeated SELECTs is rejected quickly."""
+        query = 'SELECT ' * (WiqlValidator.MAX_QUERY_LENGTH // len('SELECT '))
+
+        start = time.perf_counter()
+        with pytest.raises(ValidationError):
+            validate_wiql(query)
+        # Linear rejection takes milliseconds; the backtracking pattern took
+        # seconds. The bound is loose so loaded CI runners don't flake
+        assert time.perf_counter() - start < 1.0
+
+    def test_select_must_precede_from_target(self):
+        """Test that SELECT appearing only after FROM WorkItems is rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_wiql('FROM WorkItems SELECT [System.Id]')
+
+        assert 'SELECT clause must come before FROM' in str(exc_info.value)
+
     def test_validate_empty_query(self):
         """Test that empty queries are rejected."""
         with pytest.raises(ValidationError):
@@ -305,3 +401,39 @@ class TestWhitelistCoverage:
         ]
         for field in common_fields:
             assert field in ALLOWED_FIELDS
+
+    def test_all_fields_use_allowed_prefixes(self):
+        """Test that the field prefix pre-check covers every whitelisted field."""
+        for field in ALLOWED_FIELDS:
+            assert field.startswith(_ALLOWED_FIELD_PREFIXES)
+
+    def test_whitelist_entries_are_interned(self):
+        """Test that whitelist entries are interned for identity lookups."""
+        for name in ALLOWED_STATES | ALLOWED_WORK_ITEM_TYPES | ALLOWED_FIELDS:
+            assert sys.intern(name) is name
+
+    def test_valid_names_return_whitelist_entry(self):
+        """Test that a runtime-built valid name resolves to the interned entry."""
+        probe = ''.join(['In ', 'Progress'])
+        assert validate_state(probe) is sys.intern('In Progress')
+        assert validate_work_item_type(''.join(['User ', 'Story'])) is sys.intern('User Story')
+
+    def test_rejected_input_is_not_interned(self):
+        """Test that rejected caller input never enters the intern table."""
+        parts = ['Not', 'A', 'Real', 'State', str(id(self))]
+        bogus = ''.join(parts)
+        with pytest.raises(ValidationError):
+            validate_state(bogus)
+        with pytest.raises(ValidationError):
+            validate_work_item_type(bogus)
+
+        assert sys.intern(''.join(parts)) is not bogus
+
+    def test_rejected_field_name_is_not_interned(self):
+        """Test that a prefixed but unknown field name is not interned."""
+        parts = ['System.', 'NotAField', str(id(self))]
+        bogus = ''.join(parts)
+        with pytest.raises(ValidationError):
+            validate_field_name(bogus)
+
+        assert sys.intern(''.join(parts)) is not bogus
@@ -0,0 +1,189 @@
+"""
+Unit tests for WorkItemService batch and saved-query operations
+These tests mock the Azure DevOps clients and exercise the service logic
+"""
+import pytest
+from unittest.mock import Mock, AsyncMock, ANY
+
+from src.services.workitem_service import WorkItemService
+from src.auth import AzureDevOpsAuth
+from src.cache import Cache
+
+
+PROJECT = "TestProject"
+QUERY_ID = "Shared Queries/Active Bugs"
+WIQL = "SELECT [System.Id] FROM WorkItems WHERE [System.State] = 'Active'"
+
+
+@pytest.fixture(scope="module")
+def mock_auth():
+    """Mock auth built once per module (spec'd Mocks are costly to create)"""
+    auth = Mock(spec=AzureDevOpsAuth)
+    auth.get_client = Mock()
+    return auth
+
+
+@pytest.fixture
+def workitem_service(mock_auth):
+    """Fresh WorkItemService per test, with its shared-cache entries cleared"""
+    service = WorkItemService(mock_auth, PROJECT)
+    service._invalidate_all()
+    yield service
+    service._invalidate_all()
+
+
+@pytest.fixture
+def clock():
+    """Manually advanced monotonic clock: clock[0] is the current time"""
+    return [1000.0]
+
+
+@pytest.fixture
+def query_service(mock_auth, clock):
+    """
+    WorkItemService with a private cache on a fake clock and mocked
+    query round trips; the WIQL returns work items 1, 2 and 3
+    """
+    service = WorkItemService(mock_auth, PROJECT)
+    service.cache = Cache(clock=lambda: clock[0])
+    service.get_query = AsyncMock(return_value={'wiql': WIQL})
+    service._batch_get_work_items = AsyncMock(return_value=[])
+
+    mock_wit_client = Mock()
+    mock_wit_client.query_by_wiql = Mock(
+        return_value=Mock(work_items=[Mock(id=i) for i in (1, 2, 3)])
+    )
+    service._wit_client = mock_wit_client
+    return service
+
+
+def _echo_update(work_item_id, fields, comment=None):
+    """Stand-in for update_work_item that returns what it was asked to write"""
+    return {'id': work_item_id, 'fields': dict(fields), 'comment': comment}
+
+
+class TestBatchUpdateWorkItems:
+    """Test merging of batch updates by work item ID"""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_are_merged_into_one_write(self, workitem_service):
+        """Test that repeated IDs produce one write with later fields winning"""
+        workitem_service.update_work_item = AsyncMock(side_effect=_echo_update)
+
+        results = await workitem_service.batch_update_work_items([
+            {'id': 1, 'fields': {'System.State': 'Active', 'System.Title': 'A'}},
+            {'id': 1, 'fields': {'System.State': 'Resolved'}},
+        ])
+
+        assert workitem_service.update_work_item.await_count == 1
+        assert results == [{
+            'id': 1,
+            'fields': {'System.State': 'Resolved', 'System.Title': 'A'},
+            'comment': None,
+        }]
+
+    @pytest.mark.asyncio
+    async def test_comments_are_joined_in_order(self, workitem_service):
+        """Test that comments for the same ID are joined with newlines"""
+        workitem_service.update_work_item = AsyncMock(side_effect=_echo_update)
+
+        results = await workitem_service.batch_update_work_items([
+            {'id': 7, 'fields': {}, 'comment': 'first'},
+            {'id': 7, 'fields': {}},
+            {'id': 7, 'fields': {}, 'comment': 'second'},
+        ])
+
+        assert results[0]['comment'] == 'first\nsecond'
+
+    @pytest.mark.asyncio
+    async def test_results_follow_first_appearance_order(self, workitem_service):
+        """Test one result per distinct ID, ordered by first appearance"""
+        workitem_service.update_work_item = AsyncMock(side_effect=_echo_update)
+
+        results = await workitem_service.batch_update_work_items([
+            {'id': 3, 'fields': {}},
+            {'id': 1, 'fields': {}},
+            {'id': 3, 'fields': {}},
+            {'id': 2, 'fields': {}},
+        ])
+
+        assert [r['id'] for r in results] == [3, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_its_position(self, workitem_service):
+        """Test that a failing ID is reported in place without stopping the batch"""
+        def update(work_item_id, fields, comment=None):
+            if work_item_id == 2:
+                raise RuntimeError("boom")
+            return _echo_update(work_item_id, fields, comment)
+
+        workitem_service.update_work_item = AsyncMock(side_effect=update)
+
+        results = await workitem_service.batch_update_work_items([
+            {'id': 1, 'fields': {}},
+            {'id': 2, 'fields': {}},
+            {'id': 3, 'fields': {}},
+        ])
+
+        assert [r['id'] for r in results] == [1, 2, 3]
+        assert results[1]['success'] is False
+        assert 'boom' in results[1]['error']
+
+
+class TestExecuteQueryById:
+    """Test caching of saved-query WIQL text and result IDs"""
+
+    @pytest.mark.asyncio
+    async def test_wiql_text_expires_after_short_ttl(self, query_service, clock):
+        """Test that an edited saved query is picked up once the WIQL TTL lapses"""
+        await query_service.execute_query_by_id(QUERY_ID)
+        assert query_service.get_query.await_count == 1
+
+        # Result IDs expired, WIQL text still fresh: no definition fetch
+        clock[0] += WorkItemService.WIQL_RESULT_CACHE_TTL + 1
+        await query_service.execute_query_by_id(QUERY_ID)
+        assert query_service.get_query.await_count == 1
+        assert query_service.wit_client.query_by_wiql.call_count == 2
+
+        # WIQL text expired: the definition is fetched again
+        clock[0] += WorkItemService.QUERY_WIQL_CACHE_TTL
+        await query_service.execute_query_by_id(QUERY_ID)
+        assert query_service.get_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_ids_skip_both_round_trips(self, query_service):
+        """Test that a result-ID cache hit skips get_query and query_by_wiql"""
+        await query_service.execute_query_by_id(QUERY_ID)
+        await query_service.execute_query_by_id(QUERY_ID)
+
+        assert query_service.get_query.await_count == 1
+        assert query_service.wit_client.query_by_wiql.call_count == 1
+        # Work item details are always fetched fresh
+        assert query_service._batch_get_work_items.await_count == 2
+        query_service._batch_get_work_items.assert_awaited_with(
+            [1, 2, 3], fields=ANY, expand=ANY
+        )
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_bypasses_both_caches(self, query_service):
+        """Test that force_refresh re-fetches the WIQL text and re-runs it"""
+        await query_service.execute_query_by_id(QUERY_ID)
+        await query_service.execute_query_by_id(QUERY_ID, force_refresh=True)
+
+        assert query_service.get_query.await_count == 2
+        assert query_service.wit_client.query_by_wiql.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_cached(self, query_service):
+        """Test that an empty ID list is cached rather than re-queried"""
+        query_service.wit_client.query_by_wiql.return_value = Mock(work_items=[])
+
+        assert await query_service.execute_query_by_id(QUERY_ID) == []
+        assert await query_service.execute_query_by_id(QUERY_ID) == []
+
+        assert query_service.wit_client.query_by_wiql.call_count == 1
+        assert not query_service._batch_get_work_items.called
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])